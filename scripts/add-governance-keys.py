@@ -1,8 +1,7 @@
 #!/usr/bin/env python3
 """Add framework and independence keys to governance section in all locale files."""
 
-import json
-import os
+from locale_patch import apply_changeset
 
 # Translations for framework and independence sections
 translations = {
@@ -146,35 +145,31 @@ translations = {
     }
 }
 
-locales_dir = "/opt/gpti/gpti-site/public/locales"
-languages = ["en", "fr", "es", "de", "pt", "it"]
 
-for lang in languages:
-    file_path = os.path.join(locales_dir, lang, "common.json")
-    
-    with open(file_path, "r", encoding="utf-8") as f:
-        data = json.load(f)
-    
-    # Ensure governance section exists and merge new keys
-    if "governance" not in data:
-        data["governance"] = {}
-    
-    # Add the new keys from translations
-    lang_translations = translations[lang]
-    for key, value in lang_translations.items():
-        # Parse nested keys (e.g., "governance.framework.title")
-        parts = key.split(".")
-        current = data
-        for part in parts[:-1]:
-            if part not in current:
-                current[part] = {}
-            current = current[part]
-        current[parts[-1]] = value
-    
-    # Write back
-    with open(file_path, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
-    
-    print(f"✅ Updated {lang}/common.json")
+def changeset():
+    """Yield the translations above as (record number, record) pairs, like read_changeset()."""
+    records = (
+        {"locale": lang, "key": key, "value": value}
+        for lang, lang_translations in translations.items()
+        for key, value in lang_translations.items()
+    )
+    yield from enumerate(records, 1)
 
-print("\n✅ All locale files updated with framework and independence keys!")
+
+def main():
+    # One parse and one atomic write per locale; unchanged files are left alone.
+    planned, snapshot_id = apply_changeset(changeset())
+
+    for lang, entry in planned.items():
+        if entry["new"] is None:
+            print(f"➖ {lang}/common.json already up to date")
+        else:
+            print(f"✅ Updated {lang}/common.json")
+
+    if snapshot_id:
+        print(f"\n💾 Snapshot {snapshot_id} (undo with scripts/patch-locales.py --rollback {snapshot_id})")
+    print("\n✅ All locale files updated with framework and independence keys!")
+
+
+if __name__ == "__main__":
+    main()
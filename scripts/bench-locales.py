@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+"""Benchmark the locale files and tooling against stored baselines and budgets.
+
+Per locale it records byte size, leaf-key count, parse time (best of
+--repeat) and peak parse memory (tracemalloc). Per tool stage it times
+validate-locales.py (cold and cached, as a subprocess, the way deploy hooks
+run it), the patch engine applying the add-governance-keys.py changeset
+(dry run), compile-locales.py and split-locales.py.
+
+Every metric is checked against scripts/locale-budgets.json:
+  budgets   absolute per-locale caps ("default" plus per-language overrides)
+  baseline  values from the last --update-baseline run
+A metric fails when it exceeds its budget, or exceeds its baseline by more
+than --threshold (timings also need to be MIN_TIME_DELTA_MS slower, to ride
+out timer noise). Any failure exits 1, as does a timed stage that exits
+non-zero; no baseline is stored from such a run.
+
+--scale 10 100 also runs the stages against synthetic locales with 10x and
+100x the keys, to show how the tooling scales; those runs are reported, not
+budgeted.
+
+Usage:
+  python3 scripts/bench-locales.py [--json report.json|-] [--threshold 0.25]
+                                   [--scale N ...] [--update-baseline]
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from locale_common import (
+    LANGUAGES,
+    LOCALES_DIR,
+    NAMESPACE,
+    SCRIPTS_DIR,
+    atomic_write,
+    best_of,
+    flatten,
+    load_script,
+    locale_path,
+    minify,
+)
+from locale_patch import apply_changeset
+
+BUDGETS_FILE = SCRIPTS_DIR / "locale-budgets.json"
+MIN_TIME_DELTA_MS = 2.0
+LOCALE_METRICS = ["bytes", "leaf_keys", "parse_ms", "peak_kb"]
+
+
+def best_ms(fn, repeat):
+    return round(best_of(fn, repeat) * 1000, 3)
+
+
+def measure_locale(path, repeat):
+    raw = Path(path).read_bytes()
+    tracemalloc.start()
+    tree = json.loads(raw)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "bytes": len(raw),
+        "leaf_keys": len(flatten(tree)),
+        "parse_ms": best_ms(lambda: json.loads(raw), repeat),
+        "peak_kb": round(peak / 1024, 1),
+    }
+
+
+class StageError(RuntimeError):
+    """A timed tool stage exited non-zero, so its timing is meaningless."""
+
+
+def run_cli(script, locales_dir, cache_dir, *args):
+    env = dict(os.environ, LOCALES_DIR=str(locales_dir), LOCALE_CACHE_DIR=str(cache_dir))
+    started = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, str(SCRIPTS_DIR / f"{script}.py"), *args],
+        env=env,
+        check=False,
+        capture_output=True,
+        text=True,
+    )
+    elapsed = round((time.perf_counter() - started) * 1000, 3)
+    if result.returncode != 0:
+        output = (result.stderr or result.stdout).strip().splitlines()
+        detail = f": {output[-1]}" if output else ""
+        raise StageError(f"{script}.py exited {result.returncode} on {locales_dir}{detail}")
+    return elapsed
+
+
+def measure_stages(locales_dir, repeat):
+    """Time every tool stage against the locales in locales_dir."""
+    compile_locales = load_script("compile-locales")
+    split_locales = load_script("split-locales")
+    raws = {lang: locale_path(lang, locales_dir).read_bytes() for lang in LANGUAGES}
+    records = list(load_script("add-governance-keys").changeset())
+
+    def merge():
+        apply_changeset(iter(records), locales_dir=locales_dir, dry_run=True)
+
+    def compile_all():
+        for raw in raws.values():
+            compile_locales.compile_locale(raw)
+
+    def split_all():
+        for raw in raws.values():
+            for chunk in split_locales.split_tree(json.loads(raw)).values():
+                minify(chunk)
+
+    with tempfile.TemporaryDirectory(prefix="locale-bench-cache-") as cache_dir:
+        validate_cold = run_cli("validate-locales", locales_dir, cache_dir)
+        validate_cached = min(run_cli("validate-locales", locales_dir, cache_dir) for _ in range(repeat))
+
+    return {
+        "validate_cold_ms": validate_cold,
+        "validate_cached_ms": validate_cached,
+        "merge_ms": best_ms(merge, repeat),
+        "compile_ms": best_ms(compile_all, repeat),
+        "split_ms": best_ms(split_all, repeat),
+    }
+
+
+def scale_tree(tree, factor):
+    """Replicate every top-level section factor times under suffixed names."""
+    scaled = dict(tree)
+    for i in range(1, factor):
+        for key, value in tree.items():
+            head, dot, rest = key.partition(".")
+            scaled[f"{head}__x{i}{dot}{rest}"] = value
+    return scaled
+
+
+def write_scaled_fixture(target, factor):
+    for lang in LANGUAGES:
+        tree = json.loads(locale_path(lang).read_bytes())
+        out = Path(target) / lang / f"{NAMESPACE}.json"
+        out.parent.mkdir(parents=True, exist_ok=True)
+        out.write_text(json.dumps(scale_tree(tree, factor), ensure_ascii=False, indent=2), encoding="utf-8")
+
+
+def load_budgets():
+    try:
+        with open(BUDGETS_FILE, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {"budgets": {"default": {}}, "baseline": {}}
+
+
+def check(name, value, budget, baseline, threshold):
+    """Return a failure message for one metric, or None."""
+    if budget is not None and value > budget:
+        return f"{name} = {value} exceeds budget {budget}"
+    if baseline is not None and value > baseline * (1 + threshold):
+        if not name.endswith("_ms") or value - baseline >= MIN_TIME_DELTA_MS:
+            return f"{name} = {value} regressed >{threshold:.0%} from baseline {baseline}"
+    return None
+
+
+def evaluate(report, budgets, threshold):
+    failures = []
+    limits = budgets.get("budgets", {})
+    baseline = budgets.get("baseline", {})
+    for lang, metrics in report["locales"].items():
+        lang_budget = dict(limits.get("default", {}), **limits.get(lang, {}))
+        lang_baseline = baseline.get("locales", {}).get(lang, {})
+        for metric in LOCALE_METRICS:
+            failure = check(metric, metrics[metric], lang_budget.get(metric), lang_baseline.get(metric), threshold)
+            if failure:
+                failures.append(f"{lang}: {failure}")
+    stage_budget = limits.get("stages", {})
+    for stage, value in report["stages"].items():
+        failure = check(stage, value, stage_budget.get(stage), baseline.get("stages", {}).get(stage), threshold)
+        if failure:
+            failures.append(failure)
+    return failures
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--json", metavar="PATH", help="write the report as JSON ('-' for stdout)")
+    parser.add_argument("--threshold", type=float, default=0.25, help="allowed regression over baseline (default 0.25)")
+    parser.add_argument("--repeat", type=int, default=5, help="timing repetitions, best is kept (default 5)")
+    parser.add_argument("--scale", type=int, nargs="*", default=[], metavar="N", help="also run on Nx synthetic locales")
+    parser.add_argument("--update-baseline", action="store_true", help="store this run as the new baseline")
+    args = parser.parse_args(argv)
+
+    try:
+        report = {
+            "locales": {lang: measure_locale(locale_path(lang), args.repeat) for lang in LANGUAGES},
+            "stages": measure_stages(LOCALES_DIR, args.repeat),
+            "scaling": {},
+        }
+        for factor in args.scale:
+            with tempfile.TemporaryDirectory(prefix=f"locale-bench-x{factor}-") as fixture:
+                write_scaled_fixture(fixture, factor)
+                report["scaling"][f"x{factor}"] = {
+                    "locales": {lang: measure_locale(locale_path(lang, fixture), 1) for lang in LANGUAGES},
+                    "stages": measure_stages(fixture, 1),
+                }
+    except StageError as e:
+        print(f"❌ {e}")
+        return 1
+
+    budgets = load_budgets()
+    failures = evaluate(report, budgets, args.threshold)
+    report["failures"] = failures
+
+    if args.update_baseline:
+        budgets["baseline"] = {"locales": report["locales"], "stages": report["stages"]}
+        atomic_write(BUDGETS_FILE, json.dumps(budgets, ensure_ascii=False, indent=2) + "\n")
+
+    if args.json == "-":
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+    else:
+        if args.json:
+            atomic_write(args.json, json.dumps(report, ensure_ascii=False, indent=2))
+        print("📊 Locale files:")
+        for lang, m in report["locales"].items():
+            print(
+                f"   {lang}: {m['bytes'] / 1024:7.1f} KB  {m['leaf_keys']:>6} keys  "
+                f"parse {m['parse_ms']:7.2f} ms  peak {m['peak_kb']:8.1f} KB"
+            )
+        print("\n⏱️  Tool stages:")
+        for stage, value in report["stages"].items():
+            print(f"   {stage:<20} {value:9.2f} ms")
+        for label, run in report["scaling"].items():
+            keys = sum(m["leaf_keys"] for m in run["locales"].values())
+            size = sum(m["bytes"] for m in run["locales"].values())
+            print(f"\n📈 Scaled {label} ({keys} keys, {size / 1024 / 1024:.1f} MB):")
+            for stage, value in run["stages"].items():
+                print(f"   {stage:<20} {value:9.2f} ms")
+        if args.update_baseline:
+            print(f"\n📝 Baseline updated in {BUDGETS_FILE}")
+
+    if failures:
+        if args.json != "-":
+            print(f"\n❌ {len(failures)} budget or regression failure(s):")
+            for failure in failures:
+                print(f"   {failure}")
+        return 1
+    if args.json != "-":
+        print("\n✅ All locale metrics within budget")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
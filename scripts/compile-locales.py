@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""Compile each common.json into one canonical tree plus a flat lookup table.
+
+common.json mixes nested sections with top-level dotted keys
+("terms.meta.title"), so every lookup has to walk the tree and then fall
+back to the dotted key. This stage merges both shapes (nested wins, as in
+i18next) and reports collisions where the two shapes disagree.
+
+Outputs, under public/locales/_build/compiled/:
+  <lang>.tree.json   canonical nested tree (drop-in i18next resource)
+  <lang>.flat.json   {dotted.key: value} for single-lookup resolution
+  collisions.json    per-locale collision report
+
+--bench compares tree-walk resolution against the flat table and the load
+time of the source file against the compiled table.
+
+Usage:
+  python3 scripts/compile-locales.py [--out DIR] [--strict] [--bench]
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from locale_common import (
+    BUILD_DIR,
+    LANGUAGES,
+    best_of,
+    canonicalize,
+    content_hash,
+    flatten,
+    locale_path,
+    minify,
+    resolve_key,
+    write_if_changed,
+)
+
+COLLISIONS_FILE = "collisions.json"
+
+
+def compile_locale(raw):
+    """Compile raw common.json bytes. Returns (tree_bytes, flat_bytes, collisions)."""
+    canonical, collisions = canonicalize(json.loads(raw))
+    return minify(canonical), minify(flatten(canonical)), collisions
+
+
+def compile_all(out_dir, languages=None):
+    """Compile every locale into out_dir. Returns {lang: summary}."""
+    out_dir = Path(out_dir)
+    summary = {}
+    for lang in languages or LANGUAGES:
+        raw = locale_path(lang).read_bytes()
+        tree_bytes, flat_bytes, collisions = compile_locale(raw)
+        write_if_changed(out_dir / f"{lang}.tree.json", tree_bytes)
+        write_if_changed(out_dir / f"{lang}.flat.json", flat_bytes)
+        summary[lang] = {
+            "source_sha256": content_hash(raw),
+            "source_bytes": len(raw),
+            "tree_bytes": len(tree_bytes),
+            "flat_bytes": len(flat_bytes),
+            "collisions": collisions,
+        }
+    write_if_changed(out_dir / COLLISIONS_FILE, json.dumps(
+        {lang: info["collisions"] for lang, info in summary.items()}, ensure_ascii=False, indent=2
+    ).encode("utf-8"))
+    return summary
+
+
+def benchmark(out_dir, lang, repeat=5):
+    """Time source-vs-compiled load and tree-walk-vs-flat lookup for one locale."""
+    source_raw = locale_path(lang).read_bytes()
+    flat_raw = (Path(out_dir) / f"{lang}.flat.json").read_bytes()
+    source = json.loads(source_raw)
+    flat = json.loads(flat_raw)
+    keys = list(flat)
+
+    def walk_all():
+        for key in keys:
+            resolve_key(source, key)
+
+    def flat_all():
+        get = flat.get
+        for key in keys:
+            get(key)
+
+    return {
+        "keys": len(keys),
+        "load_source_ms": best_of(lambda: json.loads(source_raw), repeat) * 1000,
+        "load_flat_ms": best_of(lambda: json.loads(flat_raw), repeat) * 1000,
+        "lookup_walk_ns": best_of(walk_all, repeat) / len(keys) * 1e9,
+        "lookup_flat_ns": best_of(flat_all, repeat) / len(keys) * 1e9,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--out", default=str(BUILD_DIR / "compiled"), help="output directory")
+    parser.add_argument("--strict", action="store_true", help="fail when flat and nested keys collide")
+    parser.add_argument("--bench", action="store_true", help="benchmark lookups and load time after compiling")
+    args = parser.parse_args(argv)
+
+    try:
+        summary = compile_all(args.out)
+    except (OSError, json.JSONDecodeError) as e:
+        print(f"❌ Compile failed: {e}")
+        return 1
+
+    total_collisions = 0
+    for lang, info in summary.items():
+        collisions = info["collisions"]
+        total_collisions += len(collisions)
+        print(f"✅ {lang}/common.json -> {info['flat_bytes'] / 1024:.1f} KB flat table")
+        for collision in collisions:
+            print(f"   ⚠️  {collision['key']}: nested={collision['nested']!r} flat={collision['flat']!r}")
+
+    if args.bench:
+        print(f"\n⏱️  Lookup and load benchmark (best of 5):")
+        for lang in summary:
+            b = benchmark(args.out, lang)
+            print(
+                f"   {lang}: lookup {b['lookup_walk_ns']:.0f} -> {b['lookup_flat_ns']:.0f} ns/key, "
+                f"load {b['load_source_ms']:.2f} -> {b['load_flat_ms']:.2f} ms ({b['keys']} keys)"
+            )
+
+    print(f"\n📊 Collisions: {total_collisions}")
+    return 1 if args.strict and total_collisions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""Pre-tokenize locale messages and check placeholders against en.
+
+Two placeholder styles are in use:
+  {{count}}, {{- html}}, {{value, number}}   i18next interpolation
+  {avg}                                      replaced by hand in components
+and $t(other.key) nesting is understood as well. Every string in every
+locale is parsed once into static segments and argument slots, and the set
+of placeholders of each message is compared with the en message of the
+same key.
+
+Outputs, under public/locales/_build/messages/:
+  <lang>.json   {"messages": {key: message}}; a message is a plain string
+                when it has no placeholders, otherwise a list of string
+                segments and slot objects {"arg", "style", "format"?, "raw"?}
+                ("style" is "i18next", "brace" or "nest")
+  report.json   per-locale placeholder mismatches
+
+Usage:
+  python3 scripts/compile-messages.py [--out DIR] [--strict]
+"""
+
+import argparse
+import json
+import re
+import sys
+from pathlib import Path
+
+from locale_common import BUILD_DIR, LANGUAGES, REFERENCE_LANG, canonicalize, flatten, load_locale, write_if_changed
+
+PLACEHOLDER_RE = re.compile(
+    r"\{\{\s*(?P<raw>-)?\s*(?P<arg>[^{},\s]+)\s*(?:,\s*(?P<format>[^{}]*?))?\s*\}\}"
+    r"|\{(?P<brace>[A-Za-z_]\w*)\}"
+    r"|\$t\((?P<nest>[^()]+)\)"
+)
+REPORT_FILE = "report.json"
+
+
+def tokenize(text):
+    """Split a message into literal strings and slot dicts.
+
+    Returns the text itself when it contains no placeholder.
+    """
+    parts = []
+    last = 0
+    for match in PLACEHOLDER_RE.finditer(text):
+        if match.start() > last:
+            parts.append(text[last : match.start()])
+        if match.group("arg") is not None:
+            slot = {"arg": match.group("arg"), "style": "i18next"}
+            if match.group("format"):
+                slot["format"] = match.group("format").strip()
+            if match.group("raw"):
+                slot["raw"] = True
+        elif match.group("brace") is not None:
+            slot = {"arg": match.group("brace"), "style": "brace"}
+        else:
+            slot = {"arg": match.group("nest").strip(), "style": "nest"}
+        parts.append(slot)
+        last = match.end()
+    if not parts:
+        return text
+    if last < len(text):
+        parts.append(text[last:])
+    return parts
+
+
+def placeholders(message):
+    """Set of (style, arg) pairs used by a tokenized message."""
+    if isinstance(message, str):
+        return set()
+    return {(part["style"], part["arg"]) for part in message if isinstance(part, dict)}
+
+
+def compile_messages(tree):
+    """Tokenize every string leaf of a locale tree. Returns {key: message}."""
+    canonical, _ = canonicalize(tree)
+    return {key: tokenize(value) for key, value in flatten(canonical).items() if isinstance(value, str)}
+
+
+def _label(pairs):
+    """Render (style, arg) pairs back in their source syntax, for reports."""
+    templates = {"i18next": "{{{{{}}}}}", "brace": "{{{}}}", "nest": "$t({})"}
+    return sorted(templates[style].format(arg) for style, arg in pairs)
+
+
+def mismatches(reference, messages):
+    """Compare placeholder sets per key. Returns {key: {"missing", "unexpected"}}."""
+    result = {}
+    for key, message in messages.items():
+        if key not in reference:
+            continue
+        expected = placeholders(reference[key])
+        actual = placeholders(message)
+        if expected != actual:
+            result[key] = {"missing": _label(expected - actual), "unexpected": _label(actual - expected)}
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--out", default=str(BUILD_DIR / "messages"), help="output directory")
+    parser.add_argument("--strict", action="store_true", help="fail on placeholder mismatches")
+    args = parser.parse_args(argv)
+    out_dir = Path(args.out)
+
+    try:
+        compiled = {lang: compile_messages(load_locale(lang)) for lang in LANGUAGES}
+    except (OSError, json.JSONDecodeError) as e:
+        print(f"❌ Message compile failed: {e}")
+        return 1
+
+    reference = compiled[REFERENCE_LANG]
+    report = {}
+    for lang, messages in compiled.items():
+        table = json.dumps({"version": 1, "lang": lang, "messages": messages}, ensure_ascii=False, separators=(",", ":"))
+        write_if_changed(out_dir / f"{lang}.json", table)
+        slots = sum(len(placeholders(m)) for m in messages.values())
+        report[lang] = mismatches(reference, messages) if lang != REFERENCE_LANG else {}
+        status = "⚠️ " if report[lang] else "✅"
+        print(f"{status} {lang}: {len(messages)} messages, {slots} placeholder slots, {len(report[lang])} mismatched")
+        for key, diff in report[lang].items():
+            details = []
+            if diff["missing"]:
+                details.append(f"missing {', '.join(diff['missing'])}")
+            if diff["unexpected"]:
+                details.append(f"unexpected {', '.join(diff['unexpected'])}")
+            print(f"   {key}: {'; '.join(details)}")
+
+    write_if_changed(out_dir / REPORT_FILE, json.dumps(report, ensure_ascii=False, indent=2))
+    total = sum(len(r) for r in report.values())
+    print(f"\n📊 Placeholder mismatches: {total}")
+    return 1 if args.strict and total else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
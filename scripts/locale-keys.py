@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+"""Index translation-key usage across the sources and prune dead keys.
+
+Builds a key -> call-site index over app/, components/, pages/, lib/ and
+hooks/ from literal t("...") calls. The index is kept in LOCALE_CACHE_DIR
+and only files whose mtime or size changed are rescanned.
+
+Reports, against en/common.json:
+  unused   leaf keys no call site references
+  missing  keys referenced in the sources but absent from en
+
+A call that names an object (t("nav")) counts as a use of every leaf below it.
+--prune removes unused keys from all locales: each locale's own leaf keys
+are checked against the index, so keys that exist only in a translation are
+pruned too, with one parse and one atomic write per file. The originals are
+snapshotted first; undo with patch-locales.py --rollback. --keep PREFIX
+protects keys that are looked up dynamically.
+--pack reads the en keys from a pack-locales.py pack instead of the JSON;
+a pack built from a different en/common.json is refused.
+
+Usage:
+  python3 scripts/locale-keys.py [--json report.json|-] [--prune [--dry-run]]
+                                 [--keep PREFIX ...] [--where KEY] [--pack PATH]
+"""
+
+import argparse
+import json
+import sys
+
+from locale_common import (
+    CACHE_DIR,
+    LANGUAGES,
+    REFERENCE_LANG,
+    REPO_ROOT,
+    atomic_write,
+    delete_key,
+    dump_locale,
+    flatten,
+    load_locale,
+    locale_path,
+    parse_locale,
+)
+from locale_pack import LocalePack, PackError
+from locale_patch import commit, snapshot
+from locale_sources import iter_source_files, scan_file
+
+INDEX_VERSION = 1
+INDEX_FILE = "key-index.json"
+
+
+def load_index(cache_dir):
+    try:
+        with open(cache_dir / INDEX_FILE, "r", encoding="utf-8") as f:
+            index = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {"version": INDEX_VERSION, "files": {}}
+    if index.get("version") != INDEX_VERSION:
+        return {"version": INDEX_VERSION, "files": {}}
+    return index
+
+
+def update_index(root=None, cache_dir=None):
+    """Rescan changed source files and return (index, rescanned_count)."""
+    root = root or REPO_ROOT
+    cache_dir = cache_dir or CACHE_DIR
+    index = load_index(cache_dir)
+    old_files = index["files"]
+    files = {}
+    rescanned = 0
+
+    for path in iter_source_files(root):
+        rel = str(path.relative_to(root))
+        stat = path.stat()
+        entry = old_files.get(rel)
+        if entry and entry["mtime_ns"] == stat.st_mtime_ns and entry["size"] == stat.st_size:
+            files[rel] = entry
+            continue
+        files[rel] = {
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "calls": [[key, line] for key, line in scan_file(path)],
+        }
+        rescanned += 1
+
+    index = {"version": INDEX_VERSION, "files": files}
+    if rescanned or len(files) != len(old_files):
+        atomic_write(cache_dir / INDEX_FILE, json.dumps(index, ensure_ascii=False))
+    return index, rescanned
+
+
+def call_sites(index):
+    """Invert the per-file index to {key: ["path:line", ...]}."""
+    sites = {}
+    for rel, entry in sorted(index["files"].items()):
+        for key, line in entry["calls"]:
+            sites.setdefault(key, []).append(f"{rel}:{line}")
+    return sites
+
+
+def ancestors(key):
+    """Parent keys of a dotted key: "a.b.c" -> ["a", "a.b"]."""
+    parts = key.split(".")
+    return [".".join(parts[:i]) for i in range(1, len(parts))]
+
+
+def classify(leaf_keys, sites, keep=()):
+    """Return (unused, missing) key lists."""
+    unused = []
+    for key in sorted(leaf_keys):
+        if key in sites or any(key.startswith(prefix) for prefix in keep):
+            continue
+        if any(parent in sites for parent in ancestors(key)):
+            continue
+        unused.append(key)
+
+    leaf_prefixes = {parent for key in leaf_keys for parent in ancestors(key)}
+    missing = sorted(key for key in sites if key not in leaf_keys and key not in leaf_prefixes)
+    return unused, missing
+
+
+def prune(sites, keep=(), languages=None, dry_run=False):
+    """Delete the keys of every locale file that no call site references.
+
+    Returns ({lang: removed_count}, {lang: [collapsed duplicate keys]},
+    snapshot_id); a rewritten file keeps only the last definition of a
+    repeated key. The originals are snapshotted first, as patch-locales.py
+    does, so --rollback can undo a prune; snapshot_id is None when nothing
+    was written.
+    """
+    removed = {}
+    collapsed = {}
+    planned = {}
+    for lang in languages or LANGUAGES:
+        path = locale_path(lang)
+        old = path.read_bytes()
+        tree, duplicates = parse_locale(old)
+        leaf_keys = flatten(tree)
+        before = len(leaf_keys)
+        unused, _ = classify(leaf_keys, sites, keep)
+        changed = False
+        for key in unused:
+            changed = delete_key(tree, key) or changed
+        removed[lang] = before - len(flatten(tree))
+        if changed and duplicates:
+            collapsed[lang] = sorted({key for key, _ in duplicates})
+        planned[lang] = {"path": path, "old": old, "new": dump_locale(tree).encode("utf-8") if changed else None}
+
+    snapshot_id = None
+    if not dry_run and any(entry["new"] is not None for entry in planned.values()):
+        snapshot_id = snapshot(planned)
+        commit(planned)
+    return removed, collapsed, snapshot_id
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--json", metavar="PATH", help="write the report as JSON ('-' for stdout)")
+    parser.add_argument("--prune", action="store_true", help="remove unused keys from all locales")
+    parser.add_argument("--dry-run", action="store_true", help="with --prune, report without writing")
+    parser.add_argument("--keep", action="append", default=[], metavar="PREFIX", help="never treat keys under PREFIX as unused")
+    parser.add_argument("--where", metavar="KEY", help="print the call sites of KEY and exit")
+    parser.add_argument("--pack", metavar="PATH", help="read en keys from a locale pack (see pack-locales.py)")
+    args = parser.parse_args(argv)
+    if args.dry_run and not args.prune:
+        parser.error("--dry-run requires --prune")
+
+    index, rescanned = update_index()
+    sites = call_sites(index)
+
+    if args.where:
+        for site in sites.get(args.where, []):
+            print(site)
+        return 0 if args.where in sites else 1
+
+    if args.pack:
+        try:
+            with LocalePack(args.pack) as pack:
+                if pack.stale_languages([REFERENCE_LANG]):
+                    print(f"❌ {args.pack} is stale for {REFERENCE_LANG}; rebuild it with pack-locales.py")
+                    return 1
+                leaf_keys = set(pack.keys(REFERENCE_LANG))
+        except (OSError, PackError) as e:
+            print(f"❌ Cannot read pack: {e}")
+            return 1
+    else:
+        try:
+            leaf_keys = set(flatten(load_locale(REFERENCE_LANG)))
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"❌ Cannot read {REFERENCE_LANG}/common.json: {e}")
+            return 1
+    unused, missing = classify(leaf_keys, sites, args.keep)
+
+    report = {
+        "reference": REFERENCE_LANG,
+        "source_files": len(index["files"]),
+        "rescanned_files": rescanned,
+        "call_sites": sum(len(v) for v in sites.values()),
+        "referenced_keys": len(sites),
+        "leaf_keys": len(leaf_keys),
+        "unused": unused,
+        "missing": {key: sites[key] for key in missing},
+    }
+
+    if args.prune:
+        report["pruned"], report["collapsed"], report["snapshot"] = prune(sites, args.keep, dry_run=args.dry_run)
+
+    if args.json == "-":
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+        return 0
+    if args.json:
+        atomic_write(args.json, json.dumps(report, ensure_ascii=False, indent=2))
+
+    print(f"📊 Translation key usage ({REFERENCE_LANG}):")
+    print(f"   Source files: {report['source_files']} ({rescanned} rescanned)")
+    print(f"   Call sites: {report['call_sites']} referencing {report['referenced_keys']} keys")
+    print(f"   Leaf keys: {report['leaf_keys']}")
+    print(f"   Unused keys: {len(unused)}")
+    print(f"   Missing keys: {len(missing)}")
+    for key in missing:
+        print(f"   ❌ {key} ({sites[key][0]})")
+
+    if "pruned" in report:
+        verb = "Would remove" if args.dry_run else "Removed"
+        for lang, count in report["pruned"].items():
+            print(f"✅ {verb} {count} keys from {lang}/common.json")
+            if lang in report["collapsed"]:
+                print(f"   ⚠️  duplicate keys collapsed: {', '.join(report['collapsed'][lang])}")
+    if report.get("snapshot"):
+        snapshot_id = report["snapshot"]
+        print(f"\n💾 Snapshot {snapshot_id} (undo with patch-locales.py --rollback {snapshot_id})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,303 @@
+"""Shared helpers for the locale tooling in scripts/.
+
+Paths resolve relative to the repository so the scripts run the same on a
+developer checkout and on the VPS. Set LOCALES_DIR / LOCALE_CACHE_DIR to
+point them elsewhere.
+"""
+
+import copy
+import hashlib
+import importlib.util
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+REPO_ROOT = SCRIPTS_DIR.parent
+LOCALES_DIR = Path(os.environ.get("LOCALES_DIR", REPO_ROOT / "public" / "locales"))
+CACHE_DIR = Path(os.environ.get("LOCALE_CACHE_DIR", REPO_ROOT / ".cache" / "locales"))
+BUILD_DIR = LOCALES_DIR / "_build"
+
+LANGUAGES = ["en", "fr", "es", "de", "pt", "it"]
+REFERENCE_LANG = "en"
+NAMESPACE = "common"
+
+
+def locale_path(lang, locales_dir=None):
+    """Return the path of a language's common.json."""
+    return Path(locales_dir or LOCALES_DIR) / lang / f"{NAMESPACE}.json"
+
+
+def content_hash(raw):
+    """SHA-256 hex digest of raw file bytes."""
+    return hashlib.sha256(raw).hexdigest()
+
+
+def json_type(value):
+    """Name of a JSON value's type, as used in parity reports."""
+    if isinstance(value, dict):
+        return "object"
+    if isinstance(value, list):
+        return "array"
+    if isinstance(value, bool):
+        return "boolean"
+    if isinstance(value, (int, float)):
+        return "number"
+    if value is None:
+        return "null"
+    return "string"
+
+
+def flatten(tree, prefix=""):
+    """Flatten a locale tree to {dotted.key: leaf}.
+
+    Top-level keys that already contain dots ("terms.meta.title") are kept
+    verbatim, so a flat key and its nested twin map to the same dotted key.
+    Empty objects are kept as leaves so they still take part in parity checks.
+    """
+    flat = {}
+    for key, value in tree.items():
+        full_key = f"{prefix}{key}"
+        if isinstance(value, dict) and value:
+            flat.update(flatten(value, f"{full_key}."))
+        else:
+            flat[full_key] = value
+    return flat
+
+
+def key_types(tree):
+    """Map every leaf key of a tree to its JSON type name."""
+    return {key: json_type(value) for key, value in flatten(tree).items()}
+
+
+def parity_diff(reference, candidate):
+    """Compare two {key: type} maps.
+
+    Returns a dict with "missing" (in reference only), "extra" (in candidate
+    only) and "type_mismatch" ({key: [reference_type, candidate_type]}).
+    """
+    ref_keys = set(reference)
+    cand_keys = set(candidate)
+    mismatched = {
+        key: [reference[key], candidate[key]]
+        for key in sorted(ref_keys & cand_keys)
+        if reference[key] != candidate[key]
+    }
+    return {
+        "missing": sorted(ref_keys - cand_keys),
+        "extra": sorted(cand_keys - ref_keys),
+        "type_mismatch": mismatched,
+    }
+
+
+def resolve_key(tree, key):
+    """Look a key up the way i18next does: nested path first, then the flat dotted key."""
+    current = tree
+    for part in key.split("."):
+        if not isinstance(current, dict) or part not in current:
+            return tree.get(key)
+        current = current[part]
+    return current
+
+
+def set_key(tree, key, value):
+    """Set a dotted key as a nested leaf, creating parent objects as needed.
+
+    Raises ValueError if a parent on the path is already a non-object value.
+    """
+    parts = key.split(".")
+    current = tree
+    for i, part in enumerate(parts[:-1]):
+        child = current.setdefault(part, {})
+        if not isinstance(child, dict):
+            raise ValueError(f"{'.'.join(parts[: i + 1])} is a {json_type(child)}, cannot set {key}")
+        current = child
+    current[parts[-1]] = value
+
+
+def canonicalize(tree):
+    """Merge flat dotted top-level keys into the nested tree.
+
+    The nested value wins when both shapes hold a key, matching i18next's
+    lookup order. Returns (canonical_tree, collisions) where each collision is
+    {"key", "nested", "flat"} for a flat key whose nested twin disagrees or
+    whose path is blocked by a non-object value.
+    """
+    canonical = copy.deepcopy({key: value for key, value in tree.items() if "." not in key})
+    collisions = []
+    for key, value in tree.items():
+        if "." not in key:
+            continue
+        existing = resolve_key(canonical, key)
+        if existing is None:
+            try:
+                set_key(canonical, key, copy.deepcopy(value))
+                continue
+            except ValueError:
+                existing = None
+        if existing != value:
+            collisions.append({"key": key, "nested": existing, "flat": value})
+    return canonical, collisions
+
+
+def delete_key(tree, key):
+    """Remove a dotted key from a locale tree in both of its shapes.
+
+    Deletes a top-level flat entry ("terms.meta.title") and the nested leaf
+    at the same path, then drops parent objects left empty. Returns True if
+    anything was removed.
+    """
+    removed = False
+    if "." in key and key in tree:
+        del tree[key]
+        removed = True
+
+    parts = key.split(".")
+    parents = []
+    current = tree
+    for part in parts[:-1]:
+        child = current.get(part)
+        if not isinstance(child, dict):
+            return removed
+        parents.append((current, part))
+        current = child
+    if parts[-1] in current:
+        del current[parts[-1]]
+        removed = True
+        for parent, part in reversed(parents):
+            if parent[part]:
+                break
+            del parent[part]
+    return removed
+
+
+def _pairs_with_duplicates(duplicates):
+    def hook(pairs):
+        obj = {}
+        for key, value in pairs:
+            if key in obj:
+                duplicates.append((key, obj[key]))
+            obj[key] = value
+        return obj
+
+    return hook
+
+
+def parse_locale(raw):
+    """Parse common.json bytes, keeping track of repeated keys.
+
+    Returns (tree, duplicates) where duplicates lists (key, dropped_value)
+    for every earlier definition json.loads would silently overwrite.
+    """
+    duplicates = []
+    tree = json.loads(raw.decode("utf-8"), object_pairs_hook=_pairs_with_duplicates(duplicates))
+    return tree, duplicates
+
+
+def inspect_locale(raw):
+    """Parse raw common.json bytes and summarise them for validation.
+
+    Returns a JSON-serialisable dict: "valid", "error", "duplicate_keys"
+    (keys repeated within one object; json.load silently keeps the last),
+    "key_types" ({dotted.key: type}), "leaf_keys" and "parse_ms".
+    Runs in worker processes, so it must stay a module-level function.
+    """
+    started = time.perf_counter()
+    try:
+        tree, duplicates = parse_locale(raw)
+    except (UnicodeDecodeError, json.JSONDecodeError) as e:
+        return {
+            "valid": False,
+            "error": str(e),
+            "duplicate_keys": [],
+            "key_types": {},
+            "leaf_keys": 0,
+            "parse_ms": round((time.perf_counter() - started) * 1000, 3),
+        }
+    if not isinstance(tree, dict):
+        error = f"top-level value must be an object, got {json_type(tree)}"
+        types = {}
+    else:
+        error = None
+        types = key_types(tree)
+    return {
+        "valid": error is None,
+        "error": error,
+        "duplicate_keys": sorted({key for key, _ in duplicates}),
+        "key_types": types,
+        "leaf_keys": len(types),
+        "parse_ms": round((time.perf_counter() - started) * 1000, 3),
+    }
+
+
+def load_locale(lang, locales_dir=None):
+    """Parse a language's common.json."""
+    with open(locale_path(lang, locales_dir), "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def dump_locale(data):
+    """Serialize a locale tree the way the repo stores it (indent=2, UTF-8)."""
+    return json.dumps(data, ensure_ascii=False, indent=2)
+
+
+def minify(data):
+    """Serialize JSON compactly, as UTF-8 bytes, for build artifacts."""
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def atomic_write(path, data):
+    """Write bytes or text to path via a temp file and rename."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        if path.exists():
+            os.chmod(tmp_path, path.stat().st_mode & 0o777)
+        else:
+            os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
+def write_if_changed(path, data):
+    """Write only when content differs, so mtimes of unchanged artifacts stay put."""
+    path = Path(path)
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    try:
+        if path.read_bytes() == data:
+            return False
+    except FileNotFoundError:
+        pass
+    atomic_write(path, data)
+    return True
+
+
+def best_of(fn, repeat):
+    """Fastest of repeat calls to fn, in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def load_script(name):
+    """Import one of the hyphenated CLI scripts in scripts/ as a module."""
+    spec = importlib.util.spec_from_file_location(name.replace("-", "_"), SCRIPTS_DIR / f"{name}.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
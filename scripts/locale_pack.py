@@ -0,0 +1,280 @@
+"""Compact, memory-mappable locale pack.
+
+One file holds every locale. All keys and values of all locales share a
+single deduplicated UTF-8 string table, so a key stored for six languages,
+or an untranslated string identical to en, is stored once. Each locale has
+a key index sorted by key bytes, so a lookup is a binary search over the
+mapped file; nothing is parsed up front beyond the header.
+
+Layout (little-endian):
+  header      magic "GTXL", version u16, locale_count u16,
+              string_count u32, offsets_pos u32, strings_pos u32
+  directory   locale_count x (lang 8s, index_pos u32, entry_count u32,
+              source sha256 32s)
+  offsets     (string_count + 1) x u32, start of each string in the table
+  strings     concatenated UTF-8 strings
+  indexes     per locale, entry_count x (key_id u32, value_id u32,
+              kind u8, 3 pad bytes), sorted by key bytes
+
+kind is KIND_STRING for string leaves and KIND_JSON for any other leaf,
+whose value is stored as its JSON text. Keys are the canonical dotted keys
+(flat and nested shapes merged as in compile-locales.py).
+"""
+
+import json
+import mmap
+import struct
+import sys
+
+from locale_common import atomic_write, canonicalize, content_hash, flatten, json_type, locale_path
+
+MAGIC = b"GTXL"
+VERSION = 1
+HEADER = struct.Struct("<4sHHIII")
+DIRECTORY_ENTRY = struct.Struct("<8sII32s")
+OFFSET = struct.Struct("<I")
+INDEX_ENTRY = struct.Struct("<IIB3x")
+KIND_STRING = 0
+KIND_JSON = 1
+
+
+class PackError(ValueError):
+    """The file is not a locale pack this reader understands."""
+
+
+def build_pack(sources):
+    """Build pack bytes from {lang: raw common.json bytes}."""
+    string_ids = {}
+    strings = []
+
+    def intern(text):
+        encoded = text.encode("utf-8")
+        string_id = string_ids.get(encoded)
+        if string_id is None:
+            string_id = string_ids[encoded] = len(strings)
+            strings.append(encoded)
+        return string_id
+
+    indexes = []
+    for lang, raw in sources.items():
+        canonical, _ = canonicalize(json.loads(raw))
+        entries = []
+        for key, value in flatten(canonical).items():
+            if isinstance(value, str):
+                kind, text = KIND_STRING, value
+            else:
+                kind, text = KIND_JSON, json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+            entries.append((key.encode("utf-8"), intern(key), intern(text), kind))
+        entries.sort()
+        indexes.append((lang, content_hash(raw), entries))
+
+    offsets_pos = HEADER.size + DIRECTORY_ENTRY.size * len(indexes)
+    strings_pos = offsets_pos + OFFSET.size * (len(strings) + 1)
+    blob = b"".join(strings)
+    index_pos = strings_pos + len(blob)
+    index_pos += -index_pos % 4
+
+    out = bytearray(HEADER.pack(MAGIC, VERSION, len(indexes), len(strings), offsets_pos, strings_pos))
+    position = index_pos
+    for lang, digest, entries in indexes:
+        out += DIRECTORY_ENTRY.pack(lang.encode("ascii"), position, len(entries), bytes.fromhex(digest))
+        position += INDEX_ENTRY.size * len(entries)
+
+    cursor = 0
+    for encoded in strings:
+        out += OFFSET.pack(cursor)
+        cursor += len(encoded)
+    out += OFFSET.pack(cursor)
+    out += blob
+    out += b"\0" * (index_pos - len(out))
+    for _, _, entries in indexes:
+        for _, key_id, value_id, kind in entries:
+            out += INDEX_ENTRY.pack(key_id, value_id, kind)
+    return bytes(out)
+
+
+def write_pack(path, sources):
+    data = build_pack(sources)
+    atomic_write(path, data)
+    return len(data)
+
+
+class LocalePack:
+    """Read-only view over a locale pack, backed by mmap.
+
+    Use as a context manager, or call close() when done.
+    """
+
+    def __init__(self, path):
+        self._path = path
+        self._file = open(path, "rb")
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError as e:
+            self._file.close()
+            raise PackError(f"{path}: empty file") from e
+        try:
+            magic, version, locale_count, self.string_count, self._offsets_pos, self._strings_pos = (
+                HEADER.unpack_from(self._map, 0)
+            )
+        except struct.error:
+            magic = version = None
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise PackError(f"{path}: not a version {VERSION} locale pack")
+        try:
+            self._read_directory(locale_count)
+        except PackError as e:
+            self.close()
+            raise PackError(f"{path}: {e}") from None
+
+        # On little-endian hosts the offset and index arrays are read as u32
+        # views straight off the mapping, avoiding a struct call per probe.
+        self._views = []
+        self._offsets = None
+        self._indexes = {}
+        if sys.byteorder == "little":
+            whole = memoryview(self._map)
+            self._offsets = whole[self._offsets_pos : self._offsets_pos + OFFSET.size * (self.string_count + 1)].cast("I")
+            self._views = [whole, self._offsets]
+            for lang, (index_pos, count, _) in self._locales.items():
+                view = whole[index_pos : index_pos + INDEX_ENTRY.size * count].cast("I")
+                self._indexes[lang] = view
+                self._views.append(view)
+
+    def _read_directory(self, locale_count):
+        """Read the locale directory, checking every region lies inside the file."""
+        size = len(self._map)
+        offsets_end = self._offsets_pos + OFFSET.size * (self.string_count + 1)
+        if self._offsets_pos < HEADER.size + DIRECTORY_ENTRY.size * locale_count or offsets_end > self._strings_pos:
+            raise PackError("corrupt header")
+        if self._strings_pos > size or self._offsets_pos % OFFSET.size:
+            raise PackError("truncated string offsets")
+        (strings_len,) = OFFSET.unpack_from(self._map, offsets_end - OFFSET.size)
+        if self._strings_pos + strings_len > size:
+            raise PackError("truncated string table")
+        self._locales = {}
+        for i in range(locale_count):
+            lang, index_pos, count, digest = DIRECTORY_ENTRY.unpack_from(self._map, HEADER.size + i * DIRECTORY_ENTRY.size)
+            lang = lang.rstrip(b"\0").decode("ascii", "replace")
+            if index_pos < self._strings_pos + strings_len or index_pos % 4 or index_pos + INDEX_ENTRY.size * count > size:
+                raise PackError(f"truncated index for {lang}")
+            self._locales[lang] = (index_pos, count, digest.hex())
+
+    def verify(self):
+        """Check every string offset and index entry; raise PackError on the first bad one.
+
+        Opening a pack only checks region bounds; this walks the whole file.
+        """
+        previous = 0
+        for string_id in range(self.string_count + 1):
+            (offset,) = OFFSET.unpack_from(self._map, self._offsets_pos + string_id * OFFSET.size)
+            if offset < previous:
+                raise PackError(f"{self._path}: string offset {string_id} out of order")
+            previous = offset
+        for lang, (_, count, _) in self._locales.items():
+            previous_key = None
+            for i in range(count):
+                key_id, value_id, kind = self._entry(lang, i)
+                if key_id >= self.string_count or value_id >= self.string_count or kind not in (KIND_STRING, KIND_JSON):
+                    raise PackError(f"{self._path}: bad index entry {i} for {lang}")
+                key = self._string(key_id)
+                if previous_key is not None and key <= previous_key:
+                    raise PackError(f"{self._path}: index for {lang} is not sorted at entry {i}")
+                previous_key = key
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        for view in reversed(getattr(self, "_views", [])):
+            view.release()
+        self._views = []
+        if getattr(self, "_map", None) is not None:
+            self._map.close()
+            self._map = None
+        self._file.close()
+
+    @property
+    def languages(self):
+        return list(self._locales)
+
+    def source_sha256(self, lang):
+        """SHA-256 of the common.json the locale was packed from."""
+        return self._locales[lang][2]
+
+    @property
+    def size(self):
+        """Size of the mapped file in bytes."""
+        return len(self._map)
+
+    def _string(self, string_id):
+        if self._offsets is not None:
+            start, end = self._offsets[string_id], self._offsets[string_id + 1]
+        else:
+            start, end = struct.unpack_from("<II", self._map, self._offsets_pos + string_id * OFFSET.size)
+        return self._map[self._strings_pos + start : self._strings_pos + end]
+
+    def _entry(self, lang, i):
+        view = self._indexes.get(lang)
+        if view is not None:
+            # The third u32 is the kind byte followed by zero padding.
+            return view[3 * i], view[3 * i + 1], view[3 * i + 2]
+        index_pos, _, _ = self._locales[lang]
+        return INDEX_ENTRY.unpack_from(self._map, index_pos + i * INDEX_ENTRY.size)
+
+    def _decode(self, value_id, kind):
+        text = self._string(value_id).decode("utf-8")
+        return text if kind == KIND_STRING else json.loads(text)
+
+    def count(self, lang):
+        return self._locales[lang][1]
+
+    def get(self, lang, key, default=None):
+        """Value of a dotted key in one locale, by binary search."""
+        if lang not in self._locales:
+            raise KeyError(lang)
+        target = key.encode("utf-8")
+        lo, hi = 0, self._locales[lang][1]
+        while lo < hi:
+            mid = (lo + hi) // 2
+            key_id, value_id, kind = self._entry(lang, mid)
+            probe = self._string(key_id)
+            if probe < target:
+                lo = mid + 1
+            elif probe > target:
+                hi = mid
+            else:
+                return self._decode(value_id, kind)
+        return default
+
+    def keys(self, lang):
+        """Dotted keys of one locale, in sorted order."""
+        for i in range(self.count(lang)):
+            yield self._string(self._entry(lang, i)[0]).decode("utf-8")
+
+    def items(self, lang):
+        for i in range(self.count(lang)):
+            key_id, value_id, kind = self._entry(lang, i)
+            yield self._string(key_id).decode("utf-8"), self._decode(value_id, kind)
+
+    def key_types(self, lang):
+        """{key: type} for one locale, as locale_common.key_types() returns."""
+        types = {}
+        for i in range(self.count(lang)):
+            key_id, value_id, kind = self._entry(lang, i)
+            key = self._string(key_id).decode("utf-8")
+            types[key] = "string" if kind == KIND_STRING else json_type(self._decode(value_id, kind))
+        return types
+
+    def stale_languages(self, languages, locales_dir=None):
+        """Languages missing from the pack or packed from a different common.json."""
+        return [
+            lang
+            for lang in languages
+            if lang not in self._locales
+            or self.source_sha256(lang) != content_hash(locale_path(lang, locales_dir).read_bytes())
+        ]
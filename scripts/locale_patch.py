@@ -0,0 +1,199 @@
+"""Batched, atomic patching of the locale files.
+
+A changeset is a stream of records {locale, key, value, op}:
+  set      write value at key (nested form; a flat dotted twin is updated too)
+  add      like set, but only when the key does not exist yet
+  delete   remove key in both shapes (value ignored)
+
+Rewriting a file collapses keys it defines twice (only the last definition
+survives). Such collapses are listed as "collapse" changes, so a dry run
+shows everything a write would drop.
+
+Records are read lazily from JSONL or CSV and bucketed per locale, the last
+record for a (locale, key) pair winning. Every touched locale is then parsed
+once, patched in memory and, only if its bytes changed, written once through
+a temp file and rename. Nothing is written unless the whole changeset applies.
+"""
+
+import csv
+import json
+import shutil
+from datetime import datetime, timezone
+from pathlib import Path
+
+from locale_common import (
+    CACHE_DIR,
+    LANGUAGES,
+    atomic_write,
+    delete_key,
+    dump_locale,
+    locale_path,
+    parse_locale,
+    resolve_key,
+    set_key,
+)
+
+OPS = {"set", "add", "delete"}
+SNAPSHOT_DIR = "snapshots"
+
+
+class ChangesetError(ValueError):
+    """A changeset record is malformed or cannot be applied."""
+
+
+def read_jsonl(path):
+    with open(path, "r", encoding="utf-8") as f:
+        for line_no, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as e:
+                raise ChangesetError(f"{path}:{line_no}: {e}") from e
+            yield line_no, record
+
+
+def read_csv(path):
+    """CSV with a header of locale,key,value[,op]; values are strings."""
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        reader = csv.DictReader(f)
+        for record in reader:
+            yield reader.line_num, record
+
+
+def read_changeset(path, fmt=None):
+    """Yield (line, record) from a JSONL or CSV changeset."""
+    fmt = fmt or ("csv" if str(path).endswith(".csv") else "jsonl")
+    if fmt == "csv":
+        return read_csv(path)
+    if fmt == "jsonl":
+        return read_jsonl(path)
+    raise ChangesetError(f"unknown changeset format: {fmt}")
+
+
+def bucket_records(records, languages=None):
+    """Group records into {locale: {key: (op, value)}}, validating each one."""
+    languages = set(languages or LANGUAGES)
+    buckets = {}
+    for line, record in records:
+        if not isinstance(record, dict):
+            raise ChangesetError(f"line {line}: record must be an object")
+        locale = record.get("locale")
+        key = record.get("key")
+        op = record.get("op") or "set"
+        if locale not in languages:
+            raise ChangesetError(f"line {line}: unknown locale {locale!r}")
+        if not key or not isinstance(key, str) or key.startswith(".") or key.endswith(".") or ".." in key:
+            raise ChangesetError(f"line {line}: invalid key {key!r}")
+        if op not in OPS:
+            raise ChangesetError(f"line {line}: unknown op {op!r}")
+        if op != "delete" and "value" not in record:
+            raise ChangesetError(f"line {line}: {op} needs a value")
+        buckets.setdefault(locale, {})[key] = (op, record.get("value"))
+    return buckets
+
+
+def apply_ops(tree, ops):
+    """Apply {key: (op, value)} to a parsed tree in place.
+
+    Returns a list of (op, key, old, new) for the keys that actually changed.
+    """
+    changes = []
+    for key, (op, value) in ops.items():
+        old = resolve_key(tree, key)
+        if op == "delete":
+            if delete_key(tree, key):
+                changes.append(("delete", key, old, None))
+            continue
+        if op == "add" and old is not None:
+            continue
+        if old == value:
+            continue
+        try:
+            set_key(tree, key, value)
+        except ValueError as e:
+            raise ChangesetError(str(e)) from e
+        if "." in key and key in tree:
+            tree[key] = value
+        changes.append((op, key, old, value))
+    return changes
+
+
+def plan(buckets, locales_dir=None):
+    """Parse each touched locale once and apply its ops in memory.
+
+    Returns {locale: {"path", "old", "new", "changes"}} where old/new are the
+    file bytes before and after; new is None when nothing changed. When the
+    file will be rewritten, every duplicate key definition the rewrite drops
+    is listed as ("collapse", key, dropped_value, None).
+    """
+    result = {}
+    for locale, ops in buckets.items():
+        path = locale_path(locale, locales_dir)
+        old = path.read_bytes()
+        tree, duplicates = parse_locale(old)
+        changes = apply_ops(tree, ops)
+        new = dump_locale(tree).encode("utf-8") if changes else None
+        if new == old:
+            new = None
+        if new is not None:
+            changes.extend(("collapse", key, dropped, None) for key, dropped in duplicates)
+        result[locale] = {"path": path, "old": old, "new": new, "changes": changes}
+    return result
+
+
+def snapshot(planned, cache_dir=None):
+    """Copy the files about to be rewritten into a new snapshot. Returns its id."""
+    snapshot_id = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%fZ")
+    target = Path(cache_dir or CACHE_DIR) / SNAPSHOT_DIR / snapshot_id
+    for locale, entry in planned.items():
+        if entry["new"] is not None:
+            atomic_write(target / locale / entry["path"].name, entry["old"])
+    return snapshot_id
+
+
+def commit(planned):
+    """Write every changed locale. Returns the list of locales written."""
+    written = []
+    for locale, entry in planned.items():
+        if entry["new"] is not None:
+            atomic_write(entry["path"], entry["new"])
+            written.append(locale)
+    return written
+
+
+def apply_changeset(records, locales_dir=None, cache_dir=None, dry_run=False, languages=None):
+    """Bucket, plan and (unless dry_run) snapshot and write a changeset.
+
+    Returns (planned, snapshot_id); snapshot_id is None when nothing was written.
+    """
+    planned = plan(bucket_records(records, languages), locales_dir)
+    if dry_run or not any(entry["new"] is not None for entry in planned.values()):
+        return planned, None
+    snapshot_id = snapshot(planned, cache_dir)
+    commit(planned)
+    return planned, snapshot_id
+
+
+def list_snapshots(cache_dir=None):
+    base = Path(cache_dir or CACHE_DIR) / SNAPSHOT_DIR
+    return sorted(p.name for p in base.iterdir() if p.is_dir()) if base.is_dir() else []
+
+
+def rollback(snapshot_id, locales_dir=None, cache_dir=None):
+    """Restore the files saved in a snapshot. Returns the locales restored."""
+    if snapshot_id == "latest":
+        snapshots = list_snapshots(cache_dir)
+        if not snapshots:
+            raise ChangesetError("no snapshots to roll back to")
+        snapshot_id = snapshots[-1]
+    source = Path(cache_dir or CACHE_DIR) / SNAPSHOT_DIR / snapshot_id
+    if not source.is_dir():
+        raise ChangesetError(f"unknown snapshot {snapshot_id!r}")
+    restored = []
+    for lang_dir in sorted(source.iterdir()):
+        for saved in lang_dir.glob("*.json"):
+            atomic_write(locale_path(lang_dir.name, locales_dir), saved.read_bytes())
+            restored.append(lang_dir.name)
+    shutil.rmtree(source)
+    return restored
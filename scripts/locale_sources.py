@@ -0,0 +1,118 @@
+"""Static scanning of the TS/TSX sources for translation keys and routes.
+
+Only literal keys are understood: t("nav.about") and t('nav.about', ...).
+Template literals and computed keys are invisible to this scanner.
+"""
+
+import re
+from pathlib import Path
+
+from locale_common import REPO_ROOT
+
+SOURCE_DIRS = ["app", "components", "pages", "lib", "hooks"]
+SOURCE_SUFFIXES = {".ts", ".tsx", ".js", ".jsx"}
+RESOLVE_SUFFIXES = [".tsx", ".ts", ".jsx", ".js", "/index.tsx", "/index.ts", "/index.js"]
+
+T_CALL_RE = re.compile(r"""\bt\(\s*(["'])([^"'\\\n]+)\1""")
+IMPORT_RE = re.compile(r"""(?:\bfrom\s+|\bimport\s*\(\s*|\bimport\s+)["']([^"']+)["']""")
+
+
+def iter_source_files(root=None, dirs=None):
+    """Yield every TS/JS source file under the scanned trees."""
+    root = Path(root or REPO_ROOT)
+    for name in dirs or SOURCE_DIRS:
+        base = root / name
+        if not base.is_dir():
+            continue
+        for path in sorted(base.rglob("*")):
+            if path.suffix in SOURCE_SUFFIXES and path.is_file() and "node_modules" not in path.parts:
+                yield path
+
+
+def scan_text(text):
+    """Return [(key, line_number)] for every literal t() call in text."""
+    calls = []
+    for match in T_CALL_RE.finditer(text):
+        line = text.count("\n", 0, match.start()) + 1
+        calls.append((match.group(2), line))
+    return calls
+
+
+def scan_file(path):
+    return scan_text(Path(path).read_text(encoding="utf-8", errors="replace"))
+
+
+def resolve_import(spec, importer, root=None):
+    """Resolve a relative or "@/" import to a source file, or None."""
+    root = Path(root or REPO_ROOT)
+    if spec.startswith("@/"):
+        base = root / spec[2:]
+    elif spec.startswith("."):
+        base = (Path(importer).parent / spec).resolve()
+    else:
+        return None
+    if base.suffix in SOURCE_SUFFIXES and base.is_file():
+        return base
+    for suffix in RESOLVE_SUFFIXES:
+        candidate = Path(f"{base}{suffix}")
+        if candidate.is_file():
+            return candidate
+    return None
+
+
+def import_closure(entries, root=None):
+    """All local source files reachable from entries through imports."""
+    seen = set()
+    stack = [Path(entry).resolve() for entry in entries]
+    while stack:
+        path = stack.pop()
+        if path in seen:
+            continue
+        seen.add(path)
+        text = path.read_text(encoding="utf-8", errors="replace")
+        for spec in IMPORT_RE.findall(text):
+            target = resolve_import(spec, path, root)
+            if target is not None and target not in seen:
+                stack.append(target)
+    return seen
+
+
+def discover_routes(root=None):
+    """Map each public route to its entry files (page plus enclosing layouts).
+
+    Covers the app router (app/**/page.tsx, route groups stripped) and the
+    pages router (pages/**/*.tsx, excluding pages/api and _document).
+    """
+    root = Path(root or REPO_ROOT)
+    routes = {}
+
+    app_dir = root / "app"
+    for page in sorted(app_dir.rglob("page.tsx")) if app_dir.is_dir() else []:
+        rel_parts = page.parent.relative_to(app_dir).parts
+        if rel_parts and rel_parts[0] in ("api", "admin"):
+            continue
+        segments = [p for p in rel_parts if not (p.startswith("(") and p.endswith(")"))]
+        route = "/" + "/".join(segments)
+        entries = [page]
+        current = page.parent
+        while True:
+            layout = current / "layout.tsx"
+            if layout.is_file():
+                entries.append(layout)
+            if current == app_dir:
+                break
+            current = current.parent
+        routes[route] = entries
+
+    pages_dir = root / "pages"
+    app_shell = pages_dir / "_app.tsx"
+    for page in sorted(pages_dir.rglob("*.tsx")) if pages_dir.is_dir() else []:
+        rel = page.relative_to(pages_dir)
+        if rel.parts[0] in ("api", "internal") or rel.name.startswith("_"):
+            continue
+        route = "/" + str(rel.with_suffix("")).replace("\\", "/")
+        if route.endswith("/index"):
+            route = route[: -len("index")].rstrip("/") or "/"
+        routes.setdefault(route, [page] + ([app_shell] if app_shell.is_file() else []))
+
+    return routes
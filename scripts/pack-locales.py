@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""Convert the locale JSON files into one deduplicated, memory-mappable pack.
+
+Writes public/locales/_build/locales.pack (format described in
+scripts/locale_pack.py) and reports its size and load cost against the
+JSON files: bytes on disk, time and peak memory to open all six locales
+and resolve a sample of keys.
+
+Tooling reads the pack through locale_pack.LocalePack, e.g.
+locale-keys.py --pack and validate-locales.py --pack. Each locale in the
+pack records the SHA-256 of its source file; --check exits 1 when the pack
+is stale or its layout is corrupt.
+
+Usage:
+  python3 scripts/pack-locales.py [--out PATH] [--check]
+  python3 scripts/pack-locales.py --get LANG KEY
+"""
+
+import argparse
+import json
+import random
+import sys
+import tracemalloc
+
+from locale_common import BUILD_DIR, LANGUAGES, best_of, locale_path, resolve_key
+from locale_pack import LocalePack, PackError, write_pack
+
+DEFAULT_PACK = BUILD_DIR / "locales.pack"
+SAMPLE_KEYS = 200
+
+
+def measure(fn, repeat=5):
+    """Return (best ms over repeat runs, peak KB of Python allocations).
+
+    Memory is traced in a separate run, since tracemalloc slows allocation.
+    """
+    best = best_of(fn, repeat)
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best * 1000, peak / 1024
+
+
+def compare(pack_path, sample):
+    """Cost of opening all locales, and of resolving sample keys, for JSON and pack.
+
+    Returns {"json": ..., "pack": ...} with "open_ms", "open_kb" and
+    "lookup_us" (per key per locale).
+    """
+    trees = {}
+
+    def open_json():
+        for lang in LANGUAGES:
+            with open(locale_path(lang), "r", encoding="utf-8") as f:
+                trees[lang] = json.load(f)
+
+    def lookup_json():
+        for tree in trees.values():
+            for key in sample:
+                resolve_key(tree, key)
+
+    def open_pack():
+        with LocalePack(pack_path) as pack:
+            pack.get(LANGUAGES[0], sample[0])
+
+    lookups = len(sample) * len(LANGUAGES)
+    result = {}
+    open_ms, open_kb = measure(open_json)
+    result["json"] = {"open_ms": open_ms, "open_kb": open_kb, "lookup_us": measure(lookup_json)[0] * 1000 / lookups}
+    open_ms, open_kb = measure(open_pack)
+    with LocalePack(pack_path) as pack:
+
+        def lookup_pack():
+            for lang in LANGUAGES:
+                for key in sample:
+                    pack.get(lang, key)
+
+        lookup_us = measure(lookup_pack)[0] * 1000 / lookups
+    result["pack"] = {"open_ms": open_ms, "open_kb": open_kb, "lookup_us": lookup_us}
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--out", default=str(DEFAULT_PACK), help="pack file to write or read")
+    parser.add_argument("--check", action="store_true", help="exit 1 if the pack is stale instead of rebuilding")
+    parser.add_argument("--get", nargs=2, metavar=("LANG", "KEY"), help="look a key up in the pack")
+    args = parser.parse_args(argv)
+
+    try:
+        if args.get:
+            with LocalePack(args.out) as pack:
+                value = pack.get(*args.get)
+            if value is None:
+                print(f"❌ {args.get[1]} not found in {args.get[0]}")
+                return 1
+            print(value if isinstance(value, str) else json.dumps(value, ensure_ascii=False))
+            return 0
+
+        if args.check:
+            with LocalePack(args.out) as pack:
+                pack.verify()
+                stale = pack.stale_languages(LANGUAGES)
+            if stale:
+                print(f"❌ Pack is stale for: {', '.join(stale)}")
+                return 1
+            print("✅ Pack is up to date")
+            return 0
+
+        sources = {lang: locale_path(lang).read_bytes() for lang in LANGUAGES}
+        pack_bytes = write_pack(args.out, sources)
+    except (OSError, PackError, json.JSONDecodeError) as e:
+        print(f"❌ {e}")
+        return 1
+
+    json_bytes = sum(len(raw) for raw in sources.values())
+    with LocalePack(args.out) as pack:
+        keys = list(pack.keys("en"))
+        strings = pack.string_count
+        entries = sum(pack.count(lang) for lang in pack.languages)
+    sample = random.Random(0).sample(keys, min(SAMPLE_KEYS, len(keys)))
+    cost = compare(args.out, sample)
+    saving = 100 * (1 - pack_bytes / json_bytes)
+
+    print(f"✅ Wrote {args.out}")
+    print(f"\n📊 {entries} entries over {len(sources)} locales, {strings} unique strings")
+    print(f"   Size          {json_bytes / 1024:8.1f} KB JSON -> {pack_bytes / 1024:8.1f} KB pack (-{saving:.1f}%)")
+    print(f"   Open all      {cost['json']['open_ms']:8.2f} ms JSON -> {cost['pack']['open_ms']:8.2f} ms pack")
+    print(f"   Open peak     {cost['json']['open_kb']:8.1f} KB JSON -> {cost['pack']['open_kb']:8.1f} KB pack")
+    print(f"   Lookup        {cost['json']['lookup_us']:8.2f} us JSON -> {cost['pack']['lookup_us']:8.2f} us pack")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
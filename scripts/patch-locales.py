@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""Apply a batched JSONL/CSV changeset to the locale files.
+
+Each record is {"locale": "fr", "key": "nav.about", "value": "...", "op": "set"}
+(op defaults to set; also add and delete). Every touched locale is parsed
+once and written once, atomically, and only if its content changed. Before
+writing, the original files are saved to a snapshot under LOCALE_CACHE_DIR.
+
+Usage:
+  python3 scripts/patch-locales.py CHANGESET [--format jsonl|csv] [--dry-run]
+  python3 scripts/patch-locales.py --rollback SNAPSHOT|latest
+  python3 scripts/patch-locales.py --list-snapshots
+"""
+
+import argparse
+import json
+import sys
+
+from locale_patch import ChangesetError, apply_changeset, list_snapshots, read_changeset, rollback
+
+
+def _short(value, limit=80):
+    text = json.dumps(value, ensure_ascii=False)
+    return text if len(text) <= limit else text[: limit - 1] + "…"
+
+
+def print_diff(planned):
+    for locale, entry in sorted(planned.items()):
+        for op, key, old, new in entry["changes"]:
+            if op == "collapse":
+                print(f"   ! {locale} {key}: duplicate key, earlier definition dropped: {_short(old)}")
+            elif op == "delete":
+                print(f"   - {locale} {key}: {_short(old)}")
+            elif old is None:
+                print(f"   + {locale} {key}: {_short(new)}")
+            else:
+                print(f"   ~ {locale} {key}: {_short(old)} -> {_short(new)}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("changeset", nargs="?", help="JSONL or CSV changeset file")
+    parser.add_argument("--format", choices=["jsonl", "csv"], help="changeset format (default: from extension)")
+    parser.add_argument("--dry-run", action="store_true", help="print the diff without writing")
+    parser.add_argument("--rollback", metavar="SNAPSHOT", help="restore a snapshot ('latest' for the newest)")
+    parser.add_argument("--list-snapshots", action="store_true", help="list rollback snapshots")
+    args = parser.parse_args(argv)
+
+    if args.list_snapshots:
+        for snapshot_id in list_snapshots():
+            print(snapshot_id)
+        return 0
+
+    try:
+        if args.rollback:
+            restored = rollback(args.rollback)
+            for locale in restored:
+                print(f"✅ Restored {locale}/common.json")
+            return 0
+        if not args.changeset:
+            parser.error("a changeset file is required")
+        planned, snapshot_id = apply_changeset(read_changeset(args.changeset, args.format), dry_run=args.dry_run)
+    except (ChangesetError, OSError, ValueError) as e:
+        print(f"❌ {e}")
+        return 1
+
+    if args.dry_run:
+        print_diff(planned)
+    for locale, entry in sorted(planned.items()):
+        collapsed = [key for op, key, _, _ in entry["changes"] if op == "collapse"]
+        changed = len(entry["changes"]) - len(collapsed)
+        if entry["new"] is None:
+            print(f"➖ {locale}/common.json unchanged")
+            continue
+        if args.dry_run:
+            print(f"📝 {locale}/common.json would change ({changed} keys)")
+        else:
+            print(f"✅ Updated {locale}/common.json ({changed} keys)")
+        if collapsed:
+            print(f"   ⚠️  duplicate keys collapsed: {', '.join(collapsed)}")
+
+    if snapshot_id:
+        print(f"\n💾 Snapshot {snapshot_id} (undo with --rollback {snapshot_id})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""Emit minified, precompressed locale artifacts and an ETag manifest.
+
+For every locale, writes public/locales/_build/dist/<lang>/common.<hash>.json
+plus .gz and .br variants. If split-locales.py has produced namespace chunks
+(in --chunks, default public/locales/_build/chunks), each chunk is copied to
+<out>/chunks/ with its .gz and .br variants; chunks split from a different
+common.json than the current one are refused. The content hash is part of the
+filename, so artifacts can be served as immutable and an existing artifact
+is never recompressed.
+
+manifest.json maps each logical name ("en/common", "chunks/en/nav") to its
+file, relative to the output directory, SHA-256, byte sizes and a strong
+ETag per encoding.
+
+Brotli needs the optional `brotli` package (pip install brotli); without it
+the .br variants are skipped with a warning unless --require-brotli is given.
+
+Usage:
+  python3 scripts/precompress-locales.py [--out DIR] [--chunks DIR] [--require-brotli]
+"""
+
+import argparse
+import gzip
+import json
+import re
+import sys
+from pathlib import Path
+
+from locale_common import BUILD_DIR, LANGUAGES, atomic_write, content_hash, load_locale, locale_path, minify
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+HASH_LENGTH = 12
+MANIFEST_FILE = "manifest.json"
+# Only files this script names are ever pruned, so --out can share a directory.
+ARTIFACT_RE = re.compile(
+    rf"(?:[^/]+/common|chunks/[^/]+/[^/]+)\.[0-9a-f]{{{HASH_LENGTH}}}\.json(?:\.gz|\.br)?"
+)
+
+
+class StaleChunksError(ValueError):
+    """The split chunks were built from other locale files than the current ones."""
+
+
+def gzip_bytes(raw):
+    # mtime=0 keeps the output byte-for-byte reproducible between builds.
+    return gzip.compress(raw, compresslevel=9, mtime=0)
+
+
+def brotli_bytes(raw):
+    return brotli.compress(raw, quality=11, mode=brotli.MODE_TEXT)
+
+
+def etag(raw):
+    return f'"{content_hash(raw)}"'
+
+
+def emit_variants(path, raw):
+    """Write path (if missing) and its .gz/.br variants. Returns the manifest entry."""
+    if not path.exists():
+        atomic_write(path, raw)
+    entry = {"bytes": len(raw), "sha256": content_hash(raw), "etag": {"identity": etag(raw)}}
+
+    encoders = [("gzip", ".gz", gzip_bytes)]
+    if brotli is not None:
+        encoders.append(("br", ".br", brotli_bytes))
+    for encoding, suffix, encode in encoders:
+        variant = Path(f"{path}{suffix}")
+        if variant.exists():
+            compressed = variant.read_bytes()
+        else:
+            compressed = encode(raw)
+            atomic_write(variant, compressed)
+        entry[f"{encoding}_bytes"] = len(compressed)
+        entry["etag"][encoding] = etag(compressed)
+    return entry
+
+
+def build_locales(out_dir, languages=None):
+    files = {}
+    for lang in languages or LANGUAGES:
+        raw = minify(load_locale(lang))
+        rel = f"{lang}/common.{content_hash(raw)[:HASH_LENGTH]}.json"
+        entry = emit_variants(out_dir / rel, raw)
+        files[f"{lang}/common"] = dict(entry, file=rel)
+    return files
+
+
+def build_chunks(chunks_dir, out_dir):
+    """Copy and precompress the chunks listed in the split-locales manifest, if any."""
+    try:
+        with open(chunks_dir / "manifest.json", "r", encoding="utf-8") as f:
+            chunk_manifest = json.load(f)
+    except FileNotFoundError:
+        return {}
+    sources = chunk_manifest.get("sources", {})
+    stale = [
+        lang
+        for lang in chunk_manifest["locales"]
+        if sources.get(lang) != content_hash(locale_path(lang).read_bytes())
+    ]
+    if stale:
+        raise StaleChunksError(f"chunks are stale for {', '.join(stale)}; re-run split-locales.py")
+    files = {}
+    for lang, entries in chunk_manifest["locales"].items():
+        for namespace, info in entries.items():
+            rel = f"chunks/{info['file']}"
+            entry = emit_variants(out_dir / rel, (chunks_dir / info["file"]).read_bytes())
+            files[f"chunks/{lang}/{namespace}"] = dict(entry, file=rel)
+    return files
+
+
+def prune_stale(out_dir, live_files):
+    """Remove artifacts (and their variants) from earlier builds.
+
+    Files that do not match ARTIFACT_RE are never touched.
+    """
+    keep = set()
+    for rel in live_files:
+        keep.update({rel, f"{rel}.gz", f"{rel}.br"})
+    for path in out_dir.rglob("*"):
+        rel = path.relative_to(out_dir).as_posix()
+        if path.is_file() and rel not in keep and ARTIFACT_RE.fullmatch(rel):
+            path.unlink()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--out", default=str(BUILD_DIR / "dist"), help="output directory")
+    parser.add_argument("--chunks", default=str(BUILD_DIR / "chunks"), help="split-locales.py output directory")
+    parser.add_argument("--require-brotli", action="store_true", help="fail if the brotli package is missing")
+    args = parser.parse_args(argv)
+
+    if brotli is None:
+        if args.require_brotli:
+            print("❌ brotli is not installed (pip install brotli)")
+            return 1
+        print("⚠️  brotli is not installed; skipping .br variants")
+
+    out_dir = Path(args.out)
+    try:
+        files = build_locales(out_dir)
+        files.update(build_chunks(Path(args.chunks), out_dir))
+    except (OSError, ValueError) as e:
+        print(f"❌ Precompress failed: {e}")
+        return 1
+
+    prune_stale(out_dir, [entry["file"] for entry in files.values()])
+    chunk_count = sum(1 for name in files if name.startswith("chunks/"))
+    manifest = {"version": 1, "brotli": brotli is not None, "files": files}
+    atomic_write(out_dir / MANIFEST_FILE, json.dumps(manifest, ensure_ascii=False, indent=2))
+
+    for name, entry in files.items():
+        if name.startswith("chunks/"):
+            continue
+        sizes = f"{entry['bytes'] / 1024:.1f} KB, gzip {entry['gzip_bytes'] / 1024:.1f} KB"
+        if "br_bytes" in entry:
+            sizes += f", br {entry['br_bytes'] / 1024:.1f} KB"
+        print(f"✅ {entry['file']} ({sizes})")
+    if chunk_count:
+        print(f"✅ {chunk_count} namespace chunks precompressed")
+    print(f"\n📝 Manifest written to {out_dir / MANIFEST_FILE}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""Split each common.json into content-hashed per-locale, per-namespace chunks.
+
+A namespace is a top-level section of common.json (nav, methodology,
+terms, ...). Flat dotted keys ("terms.meta.title") go to the chunk of their
+first segment; top-level string keys go to the "_root" chunk. Each chunk
+holds the section exactly as it appears in common.json, so deep-merging a
+language's chunks rebuilds its file.
+
+Outputs, under public/locales/_build/chunks/:
+  <lang>/<namespace>.<hash>.json   minified chunk
+  manifest.json                    chunk files and source SHA-256 per locale,
+                                   namespaces per route
+
+The route map comes from scanning each route's import closure for literal
+t() keys, so the client only needs the active language and the namespaces
+listed for the route. A before/after byte report is printed per route.
+
+Usage:
+  python3 scripts/split-locales.py [--out DIR] [--report report.json]
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from locale_common import (
+    BUILD_DIR,
+    LANGUAGES,
+    REFERENCE_LANG,
+    atomic_write,
+    content_hash,
+    load_locale,
+    locale_path,
+    minify,
+)
+from locale_sources import discover_routes, import_closure, scan_file
+
+ROOT_NAMESPACE = "_root"
+HASH_LENGTH = 12
+MANIFEST_FILE = "manifest.json"
+
+
+def namespace_of(key, tree):
+    """Namespace a top-level key of common.json belongs to."""
+    head = key.split(".", 1)[0]
+    if "." in key or isinstance(tree.get(key), dict):
+        return head
+    return ROOT_NAMESPACE
+
+
+def split_tree(tree):
+    """Partition a locale tree into {namespace: sub-tree}."""
+    chunks = {}
+    for key, value in tree.items():
+        chunks.setdefault(namespace_of(key, tree), {})[key] = value
+    return chunks
+
+
+def route_namespaces(namespaces, root_keys, root=None):
+    """Map each route to the sorted namespaces its sources reference."""
+    routes = {}
+    file_keys = {}
+    for route, entries in discover_routes(root).items():
+        used = set()
+        for path in import_closure(entries, root):
+            if path not in file_keys:
+                file_keys[path] = {key for key, _ in scan_file(path)}
+            for key in file_keys[path]:
+                head = key.split(".", 1)[0]
+                if head in namespaces:
+                    used.add(head)
+                elif key in root_keys:
+                    used.add(ROOT_NAMESPACE)
+        routes[route] = sorted(used)
+    return routes
+
+
+def build(out_dir, languages=None, root=None):
+    """Write chunks and manifest; return (manifest, source_bytes)."""
+    languages = languages or LANGUAGES
+    out_dir = Path(out_dir)
+    manifest = {"version": 1, "reference": REFERENCE_LANG, "sources": {}, "locales": {}, "routes": {}}
+    source_bytes = {}
+    written = set()
+
+    for lang in languages:
+        source = locale_path(lang).read_bytes()
+        source_bytes[lang] = len(source)
+        manifest["sources"][lang] = content_hash(source)
+        tree = json.loads(source)
+        entries = {}
+        for namespace, chunk in sorted(split_tree(tree).items()):
+            raw = minify(chunk)
+            digest = content_hash(raw)
+            rel = f"{lang}/{namespace}.{digest[:HASH_LENGTH]}.json"
+            target = out_dir / rel
+            if not target.exists():
+                atomic_write(target, raw)
+            written.add(target)
+            entries[namespace] = {"file": rel, "bytes": len(raw), "sha256": digest}
+        manifest["locales"][lang] = entries
+
+    reference = load_locale(REFERENCE_LANG)
+    namespaces = {ns for entries in manifest["locales"].values() for ns in entries}
+    root_keys = {key for key in reference if namespace_of(key, reference) == ROOT_NAMESPACE}
+    manifest["routes"] = route_namespaces(namespaces, root_keys, root)
+
+    # Drop chunks from earlier builds that no longer belong to any locale.
+    for lang_dir in out_dir.iterdir() if out_dir.is_dir() else []:
+        if lang_dir.is_dir():
+            for stale in lang_dir.glob("*.json"):
+                if stale not in written:
+                    stale.unlink()
+
+    atomic_write(out_dir / MANIFEST_FILE, json.dumps(manifest, ensure_ascii=False, indent=2))
+    return manifest, source_bytes
+
+
+def size_report(manifest, source_bytes):
+    """Per-route bytes before (all locales bundled) and after (one locale, route namespaces)."""
+    before = sum(source_bytes.values())
+    report = {}
+    for route, namespaces in sorted(manifest["routes"].items()):
+        after = {}
+        for lang, entries in manifest["locales"].items():
+            after[lang] = sum(entries[ns]["bytes"] for ns in namespaces if ns in entries)
+        report[route] = {"namespaces": namespaces, "before_bytes": before, "after_bytes": after}
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--out", default=str(BUILD_DIR / "chunks"), help="output directory")
+    parser.add_argument("--report", metavar="PATH", help="write the per-route size report as JSON")
+    args = parser.parse_args(argv)
+
+    try:
+        manifest, source_bytes = build(args.out)
+    except (OSError, json.JSONDecodeError) as e:
+        print(f"❌ Split failed: {e}")
+        return 1
+
+    report = size_report(manifest, source_bytes)
+    chunk_count = sum(len(entries) for entries in manifest["locales"].values())
+    print(f"✅ Wrote {chunk_count} chunks for {len(manifest['locales'])} locales to {args.out}")
+    print(f"\n📊 Client payload per route (before: all locales, after: {REFERENCE_LANG} / largest locale):")
+    for route, row in report.items():
+        after_ref = row["after_bytes"].get(REFERENCE_LANG, 0)
+        after_max = max(row["after_bytes"].values(), default=0)
+        saving = 100 * (1 - after_max / row["before_bytes"]) if row["before_bytes"] else 0
+        print(
+            f"   {route:<32} {len(row['namespaces']):>3} ns  "
+            f"{row['before_bytes'] / 1024:8.1f} KB -> {after_ref / 1024:6.1f} / {after_max / 1024:6.1f} KB  "
+            f"(-{saving:.1f}%)"
+        )
+
+    if args.report:
+        atomic_write(args.report, json.dumps(report, ensure_ascii=False, indent=2))
+        print(f"\n📝 Report written to {args.report}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,35 +1,300 @@
 #!/usr/bin/env python3
-"""Validate all locale JSON files for syntax errors."""
+"""Validate all locale JSON files: syntax, duplicate keys and key parity against en.
 
+Changed files are parsed in worker processes once the change set is large
+enough to amortise start-up (see PARALLEL_MIN_BYTES). Results are cached in
+LOCALE_CACHE_DIR keyed by the SHA-256 of each file, so a run where nothing
+changed only reads and hashes the files. Parity (missing / extra / type-mismatched keys against en)
+is reported in the same pass; it fails the run only with --strict.
+
+--pack takes the key types for parity from a pack-locales.py pack, on the
+canonical keys the runtime resolves, for every locale the pack is fresh for;
+other locales fall back to their parsed or cached key types.
+
+Usage:
+  python3 scripts/validate-locales.py [--json report.json|-] [--strict]
+                                      [--no-cache] [--jobs N] [--pack PATH]
+"""
+
+import argparse
 import json
 import os
 import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+
+from locale_common import (
+    CACHE_DIR,
+    LANGUAGES,
+    LOCALES_DIR,
+    REFERENCE_LANG,
+    atomic_write,
+    content_hash,
+    inspect_locale,
+    locale_path,
+    parity_diff,
+)
+from locale_pack import LocalePack, PackError
+
+CACHE_VERSION = 1
+INDEX_FILE = "validate-index.json"
+KEYS_DIR = "keys"
+# Below this many changed bytes, process start-up costs more than it saves.
+PARALLEL_MIN_BYTES = 1024 * 1024
+
+
+def load_index(cache_dir):
+    try:
+        with open(cache_dir / INDEX_FILE, "r", encoding="utf-8") as f:
+            index = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {"version": CACHE_VERSION, "files": {}}
+    if index.get("version") != CACHE_VERSION:
+        return {"version": CACHE_VERSION, "files": {}}
+    return index
+
+
+def load_key_types(cache_dir, digest):
+    """Key-type map of a previously parsed file, or None if not cached."""
+    try:
+        with open(cache_dir / KEYS_DIR / f"{digest}.json", "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+
+
+def store_key_types(cache_dir, digest, types):
+    atomic_write(cache_dir / KEYS_DIR / f"{digest}.json", json.dumps(types, ensure_ascii=False))
+
+
+def prune_key_types(cache_dir, live_digests):
+    keys_dir = cache_dir / KEYS_DIR
+    if not keys_dir.is_dir():
+        return
+    for entry in keys_dir.iterdir():
+        if entry.suffix == ".json" and entry.stem not in live_digests:
+            entry.unlink(missing_ok=True)
+
+
+def pack_key_types(pack, lang, digest):
+    """Key types of lang from the pack, or None if it was packed from other content."""
+    if pack is None or lang not in pack.languages or pack.source_sha256(lang) != digest:
+        return None
+    return pack.key_types(lang)
+
+
+def read_locales(languages, locales_dir):
+    """Read and hash every locale file. Returns {lang: (raw|None, digest|None)}."""
+    files = {}
+    for lang in languages:
+        try:
+            raw = locale_path(lang, locales_dir).read_bytes()
+        except FileNotFoundError:
+            files[lang] = (None, None)
+            continue
+        files[lang] = (raw, content_hash(raw))
+    return files
+
+
+def parse_changed(changed, jobs):
+    """Run inspect_locale over {lang: raw}, in parallel when it pays off."""
+    if jobs <= 1 or len(changed) <= 1 or sum(map(len, changed.values())) < PARALLEL_MIN_BYTES:
+        return {lang: inspect_locale(raw) for lang, raw in changed.items()}
+    with ProcessPoolExecutor(max_workers=min(jobs, len(changed))) as pool:
+        futures = {lang: pool.submit(inspect_locale, raw) for lang, raw in changed.items()}
+        return {lang: future.result() for lang, future in futures.items()}
 
-locales_dir = "/opt/gpti/gpti-site/public/locales"
-languages = ["en", "fr", "es", "de", "pt", "it"]
 
-total_errors = 0
+def validate(languages=None, locales_dir=None, cache_dir=None, use_cache=True, jobs=None, pack=None):
+    """Validate locales and return the report dict (see --json output).
 
-for lang in languages:
-    file_path = os.path.join(locales_dir, lang, "common.json")
-    
+    pack is an open LocalePack to take parity key types from, if any.
+    """
+    started = time.perf_counter()
+    languages = languages or LANGUAGES
+    locales_dir = locales_dir or LOCALES_DIR
+    cache_dir = cache_dir or CACHE_DIR
+    jobs = jobs or os.cpu_count() or 1
+
+    index = load_index(cache_dir) if use_cache else {"version": CACHE_VERSION, "files": {}}
+    cached_files = index["files"]
+    files = read_locales(languages, locales_dir)
+
+    changed = {
+        lang: raw
+        for lang, (raw, digest) in files.items()
+        if raw is not None and cached_files.get(lang, {}).get("sha256") != digest
+    }
+    parsed = parse_changed(changed, jobs)
+
+    ref_digest = files.get(REFERENCE_LANG, (None, None))[1]
+    ref_entry = parsed.get(REFERENCE_LANG) or cached_files.get(REFERENCE_LANG, {})
+    if not ref_entry.get("valid"):
+        # An unparseable reference has no keys to diff against.
+        ref_digest = None
+    ref_types = None
+    if ref_digest and REFERENCE_LANG in parsed:
+        ref_types = parsed[REFERENCE_LANG]["key_types"]
+    pack_ref_types = pack_key_types(pack, REFERENCE_LANG, ref_digest)
+    packed = []
+
+    report_files = {}
+    new_index_files = {}
+    for lang in languages:
+        raw, digest = files[lang]
+        path = str(locale_path(lang, locales_dir))
+        if raw is None:
+            report_files[lang] = {"path": path, "valid": False, "error": "File not found", "cached": False}
+            continue
+
+        lang_started = time.perf_counter()
+        entry = cached_files.get(lang) if lang not in parsed else None
+        if entry is None:
+            result = parsed[lang]
+            entry = {
+                "sha256": digest,
+                "bytes": len(raw),
+                "valid": result["valid"],
+                "error": result["error"],
+                "duplicate_keys": result["duplicate_keys"],
+                "leaf_keys": result["leaf_keys"],
+                "parse_ms": result["parse_ms"],
+            }
+            if result["valid"] and use_cache:
+                store_key_types(cache_dir, digest, result["key_types"])
+            cached = False
+        else:
+            cached = True
+
+        parity = None
+        if entry["valid"] and ref_digest and lang != REFERENCE_LANG:
+            pack_types = pack_key_types(pack, lang, digest) if pack_ref_types is not None else None
+            if pack_types is not None:
+                # Parity on canonical keys; kept out of the file-based parity cache.
+                parity = parity_diff(pack_ref_types, pack_types)
+                packed.append(lang)
+            else:
+                if entry.get("parity_ref") == ref_digest and "parity" in entry:
+                    parity = entry["parity"]
+                else:
+                    if ref_types is None:
+                        ref_types = load_key_types(cache_dir, ref_digest)
+                    lang_types = parsed[lang]["key_types"] if lang in parsed else load_key_types(cache_dir, digest)
+                    if ref_types is not None and lang_types is not None:
+                        parity = parity_diff(ref_types, lang_types)
+                if parity is not None:
+                    entry = dict(entry, parity_ref=ref_digest, parity=parity)
+        new_index_files[lang] = entry
+
+        report_files[lang] = {
+            "path": path,
+            "sha256": digest,
+            "bytes": entry["bytes"],
+            "cached": cached,
+            "valid": entry["valid"],
+            "error": entry["error"],
+            "duplicate_keys": entry["duplicate_keys"],
+            "leaf_keys": entry["leaf_keys"],
+            "parse_ms": 0.0 if cached else entry["parse_ms"],
+            "elapsed_ms": round((time.perf_counter() - lang_started) * 1000, 3),
+            "parity": parity,
+        }
+
+    if use_cache:
+        atomic_write(cache_dir / INDEX_FILE, json.dumps({"version": CACHE_VERSION, "files": new_index_files}))
+        prune_key_types(cache_dir, {entry["sha256"] for entry in new_index_files.values()})
+
+    return {
+        "generated_at": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "reference": REFERENCE_LANG,
+        "locales_dir": str(locales_dir),
+        "parsed": sorted(parsed),
+        "parity_from_pack": packed,
+        "total_ms": round((time.perf_counter() - started) * 1000, 3),
+        "files": report_files,
+    }
+
+
+def summarize(report):
+    """Count syntax errors and parity issues in a report."""
+    errors = sum(1 for f in report["files"].values() if not f["valid"])
+    parity_issues = 0
+    for f in report["files"].values():
+        parity = f.get("parity")
+        if parity:
+            parity_issues += len(parity["missing"]) + len(parity["extra"]) + len(parity["type_mismatch"])
+    return errors, parity_issues
+
+
+def print_report(report):
+    for lang, f in report["files"].items():
+        name = f"{lang}/common.json"
+        if not f["valid"]:
+            if f["error"] == "File not found":
+                print(f"⚠️  {name} - File not found")
+            else:
+                print(f"❌ {name} - JSON Error: {f['error']}")
+            continue
+        source = "cached" if f["cached"] else f"parsed in {f['parse_ms']:.1f} ms"
+        print(f"✅ {name} - Valid JSON ({f['leaf_keys']} keys, {source})")
+        if f["duplicate_keys"]:
+            print(f"   ⚠️  duplicate keys: {', '.join(f['duplicate_keys'])}")
+        parity = f.get("parity")
+        if parity and (parity["missing"] or parity["extra"] or parity["type_mismatch"]):
+            print(
+                f"   ⚠️  vs {report['reference']}: {len(parity['missing'])} missing, "
+                f"{len(parity['extra'])} extra, {len(parity['type_mismatch'])} type mismatches"
+            )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--json", metavar="PATH", help="write the JSON report to PATH ('-' for stdout)")
+    parser.add_argument("--strict", action="store_true", help="fail on key-parity differences as well")
+    parser.add_argument("--no-cache", action="store_true", help="ignore and do not update the cache")
+    parser.add_argument("--jobs", type=int, default=None, help="parallel parser processes (default: CPU count)")
+    parser.add_argument("--pack", metavar="PATH", help="take parity key types from a locale pack (see pack-locales.py)")
+    args = parser.parse_args(argv)
+
+    pack = None
+    if args.pack:
+        try:
+            pack = LocalePack(args.pack)
+        except (OSError, PackError) as e:
+            print(f"❌ Cannot read pack: {e}")
+            return 1
     try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            json.load(f)
-        print(f"✅ {lang}/common.json - Valid JSON")
-    except json.JSONDecodeError as e:
-        print(f"❌ {lang}/common.json - JSON Error: {e}")
-        total_errors += 1
-    except FileNotFoundError:
-        print(f"⚠️  {lang}/common.json - File not found")
-        total_errors += 1
-
-print(f"\n📊 Validation Summary:")
-print(f"   Total errors: {total_errors}")
-
-if total_errors == 0:
-    print("\n✅ All locale files are valid JSON!")
-    sys.exit(0)
-else:
-    print(f"\n❌ {total_errors} file(s) have errors")
-    sys.exit(1)
+        report = validate(use_cache=not args.no_cache, jobs=args.jobs, pack=pack)
+    finally:
+        if pack is not None:
+            pack.close()
+    errors, parity_issues = summarize(report)
+
+    if args.json == "-":
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+    else:
+        print_report(report)
+        if args.json:
+            atomic_write(args.json, json.dumps(report, ensure_ascii=False, indent=2))
+
+        print(f"\n📊 Validation Summary:")
+        print(f"   Total errors: {errors}")
+        print(f"   Parity differences: {parity_issues}")
+        print(f"   Elapsed: {report['total_ms']:.1f} ms ({len(report['parsed'])} file(s) parsed)")
+        if args.pack:
+            print(f"   Parity from pack: {', '.join(report['parity_from_pack']) or 'none (pack is stale)'}")
+
+    failed = errors > 0 or (args.strict and parity_issues > 0)
+    if args.json != "-":
+        if not failed:
+            print("\n✅ All locale files are valid JSON!")
+        elif errors:
+            print(f"\n❌ {errors} file(s) have errors")
+        else:
+            print(f"\n❌ {parity_issues} key-parity difference(s) (--strict)")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+"""Watch the locale files and revalidate (and recompile) only what changed.
+
+Keeps every locale's key tree in memory, so a save of fr/common.json
+re-reads and re-parses that one file, diffs it against the in-memory en
+tree and recompiles only fr, refreshing collisions.json alongside. Saving
+en re-diffs every other locale from memory without reading them again.
+
+Change detection uses inotify on Linux (directory watches, so editors that
+save by rename are seen too) and falls back to polling file stats
+elsewhere. Bursts of writes are coalesced: a locale is processed once no
+event has arrived for --debounce milliseconds. A save whose bytes hash the
+same as the last seen version is ignored.
+
+Usage:
+  python3 scripts/watch-locales.py [--debounce 25] [--poll] [--no-compile]
+"""
+
+import argparse
+import ctypes
+import ctypes.util
+import json
+import os
+import select
+import struct
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+from locale_common import (
+    BUILD_DIR,
+    LANGUAGES,
+    LOCALES_DIR,
+    NAMESPACE,
+    REFERENCE_LANG,
+    content_hash,
+    inspect_locale,
+    locale_path,
+    load_script,
+    parity_diff,
+    write_if_changed,
+)
+
+POLL_INTERVAL = 0.05
+
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+EVENT_HEADER = struct.Struct("iIII")
+
+
+class InotifySource:
+    """Report which locales had file events, via inotify directory watches."""
+
+    def __init__(self, languages, locales_dir):
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        if not hasattr(libc, "inotify_init1"):
+            raise OSError("inotify is not available")
+        self.fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.watches = {}
+        mask = IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE | IN_DELETE | IN_MODIFY
+        for lang in languages:
+            directory = os.fsencode(str(Path(locales_dir) / lang))
+            wd = libc.inotify_add_watch(self.fd, directory, mask)
+            if wd < 0:
+                raise OSError(ctypes.get_errno(), f"cannot watch {directory.decode()}")
+            self.watches[wd] = lang
+        self.filename = os.fsencode(f"{NAMESPACE}.json")
+
+    def wait(self, timeout):
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return set()
+        changed = set()
+        buffer = os.read(self.fd, 64 * 1024)
+        offset = 0
+        while offset < len(buffer):
+            wd, _, _, length = EVENT_HEADER.unpack_from(buffer, offset)
+            offset += EVENT_HEADER.size
+            name = buffer[offset : offset + length].rstrip(b"\0")
+            offset += length
+            if name == self.filename and wd in self.watches:
+                changed.add(self.watches[wd])
+        return changed
+
+
+class PollingSource:
+    """Report which locales changed, by polling (mtime, size, inode)."""
+
+    def __init__(self, languages, locales_dir):
+        self.paths = {lang: locale_path(lang, locales_dir) for lang in languages}
+        self.stats = {lang: self._stat(path) for lang, path in self.paths.items()}
+
+    @staticmethod
+    def _stat(path):
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            return None
+        return st.st_mtime_ns, st.st_size, st.st_ino
+
+    def wait(self, timeout):
+        time.sleep(POLL_INTERVAL if timeout is None else min(timeout, POLL_INTERVAL))
+        changed = set()
+        for lang, path in self.paths.items():
+            current = self._stat(path)
+            if current != self.stats[lang]:
+                self.stats[lang] = current
+                changed.add(lang)
+        return changed
+
+
+class LocaleState:
+    """In-memory validation state for every locale."""
+
+    def __init__(self, languages, locales_dir, compiler=None, compiled_dir=None):
+        self.languages = languages
+        self.locales_dir = locales_dir
+        self.compiler = compiler
+        self.compiled_dir = Path(compiled_dir) if compiled_dir else None
+        self.digests = {}
+        self.results = {}
+        self.parity = {}
+        self.collisions = {}
+
+    def refresh(self, lang):
+        """Re-read one locale. Returns False if its content did not change."""
+        try:
+            raw = locale_path(lang, self.locales_dir).read_bytes()
+        except FileNotFoundError:
+            self.digests[lang] = None
+            self.results[lang] = {"valid": False, "error": "File not found", "key_types": {}, "duplicate_keys": []}
+            return True
+        digest = content_hash(raw)
+        if digest == self.digests.get(lang):
+            return False
+        self.digests[lang] = digest
+        self.results[lang] = inspect_locale(raw)
+        if self.compiler is not None and self.results[lang]["valid"]:
+            tree_bytes, flat_bytes, collisions = self.compiler.compile_locale(raw)
+            write_if_changed(self.compiled_dir / f"{lang}.tree.json", tree_bytes)
+            write_if_changed(self.compiled_dir / f"{lang}.flat.json", flat_bytes)
+            self.results[lang]["collisions"] = len(collisions)
+            self.collisions[lang] = collisions
+        return True
+
+    def write_collisions(self):
+        """Rewrite the collisions report next to the compiled trees, as compile_all() does."""
+        report = {lang: self.collisions[lang] for lang in self.languages if lang in self.collisions}
+        write_if_changed(self.compiled_dir / self.compiler.COLLISIONS_FILE, json.dumps(
+            report, ensure_ascii=False, indent=2
+        ).encode("utf-8"))
+
+    def rediff(self, lang):
+        reference = self.results.get(REFERENCE_LANG)
+        result = self.results.get(lang)
+        if lang == REFERENCE_LANG or not reference or not reference["valid"] or not result or not result["valid"]:
+            self.parity[lang] = None
+        else:
+            self.parity[lang] = parity_diff(reference["key_types"], result["key_types"])
+
+    def process(self, langs):
+        """Refresh langs and re-diff whatever their change affects. Returns changed langs."""
+        changed = [lang for lang in self.languages if lang in langs and self.refresh(lang)]
+        if self.compiler is not None and changed:
+            self.write_collisions()
+        to_diff = set(self.languages) if REFERENCE_LANG in changed else set(changed)
+        for lang in to_diff:
+            self.rediff(lang)
+        return changed, sorted(to_diff - set(changed), key=self.languages.index)
+
+    def describe(self, lang):
+        result = self.results[lang]
+        name = f"{lang}/{NAMESPACE}.json"
+        if not result["valid"]:
+            return f"❌ {name} - {result['error']}"
+        parts = [f"✅ {name} - {result['leaf_keys']} keys"]
+        if result["duplicate_keys"]:
+            parts.append(f"duplicates: {', '.join(result['duplicate_keys'])}")
+        parity = self.parity.get(lang)
+        if parity:
+            parts.append(
+                f"vs {REFERENCE_LANG}: {len(parity['missing'])} missing, {len(parity['extra'])} extra, "
+                f"{len(parity['type_mismatch'])} type mismatches"
+            )
+        if "collisions" in result:
+            parts.append(f"compiled ({result['collisions']} collisions)")
+        return " · ".join(parts)
+
+
+def make_source(languages, locales_dir, poll):
+    if not poll and sys.platform.startswith("linux"):
+        try:
+            return InotifySource(languages, locales_dir), "inotify"
+        except OSError as e:
+            print(f"⚠️  inotify unavailable ({e}); falling back to polling")
+    return PollingSource(languages, locales_dir), "polling"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--debounce", type=float, default=25, help="quiet period in ms before processing (default 25)")
+    parser.add_argument("--poll", action="store_true", help="poll file stats instead of using inotify")
+    parser.add_argument("--no-compile", action="store_true", help="validate only, do not recompile")
+    args = parser.parse_args(argv)
+
+    compiler = None if args.no_compile else load_script("compile-locales")
+    state = LocaleState(LANGUAGES, LOCALES_DIR, compiler, BUILD_DIR / "compiled")
+    source, mode = make_source(LANGUAGES, LOCALES_DIR, args.poll)
+
+    started = time.perf_counter()
+    state.process(set(LANGUAGES))
+    for lang in LANGUAGES:
+        print(state.describe(lang))
+    print(f"\n👀 Watching {LOCALES_DIR} ({mode}, loaded in {(time.perf_counter() - started) * 1000:.0f} ms)")
+
+    debounce = args.debounce / 1000
+    pending = set()
+    first_event = deadline = None
+    try:
+        while True:
+            timeout = max(0.0, deadline - time.perf_counter()) if pending else None
+            events = source.wait(timeout)
+            now = time.perf_counter()
+            if events:
+                if not pending:
+                    first_event = now
+                pending |= events
+                deadline = now + debounce
+                continue
+            if not pending or now < deadline:
+                continue
+
+            changed, rediffed = state.process(pending)
+            pending = set()
+            if not changed:
+                continue
+            stamp = datetime.now().strftime("%H:%M:%S")
+            elapsed = (time.perf_counter() - first_event) * 1000
+            for lang in changed:
+                print(f"[{stamp}] {state.describe(lang)} ({elapsed:.0f} ms)")
+            for lang in rediffed:
+                print(f"[{stamp}]    ↳ {state.describe(lang)}")
+    except KeyboardInterrupt:
+        print("\n👋 Stopped watching")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())